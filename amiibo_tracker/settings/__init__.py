@@ -1,24 +1,9 @@
-import os
-
-from django.core.exceptions import ImproperlyConfigured
-
-from .base import *
-
-
-# Determine environment and import specific settings
-ENV = os.getenv("ENV_NAME", "development")  # Default to 'development' if not set
-
-if ENV == "production":
-    from .production import *
-elif ENV == "development":
-    from .development import *
-# You can add more elif for 'staging', 'testing', etc.
-else:
-    raise ImproperlyConfigured(
-        f"Unknown ENV_NAME: {ENV}. Must be 'development' or 'production'."
-    )
-
-try:
-    from .local_settings import *
-except ImportError:
-    pass
+# Settings are selected through DJANGO_SETTINGS_MODULE, pointing directly at one
+# of the leaf modules in this package:
+#
+#   amiibo_tracker.settings.development  (default for manage.py / wsgi.py)
+#   amiibo_tracker.settings.production   (Docker image / Cloud Run)
+#   amiibo_tracker.settings.testing      (pytest)
+#
+# Each process therefore imports exactly one leaf (plus base.py), instead of
+# importing base.py here and then dispatching on ENV_NAME.
@@ -1,17 +1,28 @@
 from pathlib import Path
 import os
-import logging
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
+_TRUTHY = frozenset({"1", "true", "yes", "on", "y", "t"})
+
+
+def env_bool(key, default=False):
+    value = os.environ.get(key)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUTHY
+
+
 STATIC_URL = "/static/"
+# Stored as plain strings so WhiteNoise and the staticfiles finders don't have
+# to coerce Path objects on every startup walk.
 STATICFILES_DIRS = [
-    BASE_DIR / "static",
+    str(BASE_DIR / "static"),
 ]
-STATIC_ROOT = BASE_DIR / "staticfiles"
+STATIC_ROOT = str(BASE_DIR / "staticfiles")
 
 SECRET_KEY = os.environ.get("DJANGO_SECRET_KEY", "unsafe-default-key")
-DEBUG = os.environ.get("DEBUG", "True").lower() == "true"
+DEBUG = env_bool("DEBUG", default=True)
 ALLOWED_HOSTS = [h for h in os.environ.get("ALLOWED_HOSTS", "").split(",") if h]
 CSRF_TRUSTED_ORIGINS = [
     origin for origin in os.environ.get("CSRF_TRUSTED_ORIGINS", "").split(",") if origin
@@ -92,11 +103,6 @@ CACHES = {
 # we do not rely on any database tables being present.
 SESSION_ENGINE = "django.contrib.sessions.backends.signed_cookies"
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(name)s %(message)s",
-)
-
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
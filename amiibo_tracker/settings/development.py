@@ -20,3 +20,8 @@ DATABASES = {
 INTERNAL_IPS = [
     "127.0.0.1",
 ]
+
+try:
+    from .local_settings import *
+except ImportError:
+    pass
@@ -1,7 +1,5 @@
 import os
 
-import dj_database_url
-
 from .base import *  # noqa: F401,F403
 
 os.environ["ENV_NAME"] = "production"
@@ -9,23 +7,38 @@ DEBUG = False
 
 ALLOWED_HOSTS = ALLOWED_HOSTS or ["goozamiibo.com"]
 
+# Hosts that never map to a trusted HTTPS origin.
+_NON_ORIGIN_HOSTS = frozenset({"*", "localhost"})
+
 default_db_path = os.environ.get("DJANGO_SQLITE_PATH", "/tmp/db.sqlite3")
 
-DATABASES = {
-    "default": dj_database_url.config(
-        default=f"sqlite:///{default_db_path}", conn_max_age=600
-    )
-}
 
-STATIC_ROOT = BASE_DIR / "staticfiles"
-MEDIA_ROOT = BASE_DIR / "mediafiles"
+def _default_database():
+    # Only pull in dj_database_url when DATABASE_URL is actually set; Cloud Run
+    # runs on the local SQLite fallback, so most processes (collectstatic,
+    # management commands, gunicorn workers) never need the URL parser.
+    if not os.environ.get("DATABASE_URL"):
+        return {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": default_db_path,
+            "CONN_MAX_AGE": 600,
+        }
+
+    import dj_database_url
+
+    return dj_database_url.config(conn_max_age=600)
+
+
+DATABASES = {"default": _default_database()}
+
+MEDIA_ROOT = str(BASE_DIR / "mediafiles")
 
 # Accept HTTPS POSTs from the production hosts so Django's CSRF middleware
 # works when the app is served on custom domains (required for OAuth callbacks
 # and authenticated form submissions).
-CSRF_TRUSTED_ORIGINS = CSRF_TRUSTED_ORIGINS or [
-    f"https://{host}" for host in ALLOWED_HOSTS if host not in {"*", "localhost"}
-]
+CSRF_TRUSTED_ORIGINS = CSRF_TRUSTED_ORIGINS or tuple(
+    f"https://{host}" for host in ALLOWED_HOSTS if host not in _NON_ORIGIN_HOSTS
+)
 
 SECURE_BROWSER_XSS_FILTER = True
 SECURE_CONTENT_TYPE_NOSNIFF = True
@@ -35,7 +48,7 @@ X_FRAME_OPTIONS = "DENY"
 # Cloud Run terminates TLS before forwarding requests to the container. Rely on
 # the platform to handle HTTPS enforcement unless explicitly overridden so the
 # app can return a 200 on custom domains without triggering an extra redirect.
-SECURE_SSL_REDIRECT = os.environ.get("SECURE_SSL_REDIRECT", "false").lower() == "true"
+SECURE_SSL_REDIRECT = env_bool("SECURE_SSL_REDIRECT")
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 USE_X_FORWARDED_HOST = True
 
@@ -52,7 +52,9 @@ STORAGES = {
     }
 }
 
-# Simplify password hashing for faster tests
+# Simplify password hashing for faster tests. MD5PasswordHasher is the cheapest
+# hasher Django still ships (UnsaltedMD5PasswordHasher was removed in 5.1), and
+# the app never stores passwords — users authenticate through Google OAuth.
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
 ]
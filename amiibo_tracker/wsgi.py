@@ -1,5 +1,5 @@
 import os
 from django.core.wsgi import get_wsgi_application
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "amiibo_tracker.settings")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "amiibo_tracker.settings.development")
 application = get_wsgi_application()
@@ -2,13 +2,13 @@ import os
 
 
 class OauthConstants:
-    SCOPES = [
+    SCOPES = (
         "https://www.googleapis.com/auth/userinfo.profile",
         "https://www.googleapis.com/auth/userinfo.email",
         "openid",
         "https://www.googleapis.com/auth/spreadsheets",
         "https://www.googleapis.com/auth/drive.file",
-    ]
+    )
     DEFAULT_REDIRECT_URI = "https://goozamiibo.com/oauth2callback/"
     REDIRECT_URI = DEFAULT_REDIRECT_URI
 
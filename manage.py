@@ -3,7 +3,9 @@ import os
 import sys
 
 if __name__ == "__main__":
-    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "amiibo_tracker.settings")
+    os.environ.setdefault(
+        "DJANGO_SETTINGS_MODULE", "amiibo_tracker.settings.development"
+    )
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
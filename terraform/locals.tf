@@ -19,6 +19,10 @@ locals {
       name  = "ENV_NAME"
       value = "production"
     },
+    {
+      name  = "DJANGO_SETTINGS_MODULE"
+      value = "amiibo_tracker.settings.production"
+    },
     {
       name  = "DJANGO_SECRET_KEY"
       value = var.django_secret_key
@@ -17,7 +17,15 @@ from django.conf import settings
 # Initialize Django for tests
 django.setup()
 
+from django.http import HttpRequest
+from django.test import RequestFactory
+
 from tracker.google_sheet_client_manager import GoogleSheetClientManager
+from tracker.helpers import AmiiboRemoteFetchMixin
+
+
+class FakeSession(dict):
+    """Plain dict standing in for request.session; views only call get()."""
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -26,6 +34,89 @@ def configure_settings():
     return settings
 
 
+@pytest.fixture(scope="session")
+def rf():
+    """RequestFactory is stateless, so one instance serves the whole run."""
+    return RequestFactory()
+
+
+def make_get_request(path):
+    """Hand-build a bare GET request for views that never touch middleware.
+
+    Skips RequestFactory's WSGI environ construction; only the attributes the
+    blog/detail views and their templates read are populated.
+    """
+    request = HttpRequest()
+    request.method = "GET"
+    request.path = request.path_info = path
+    request.META = {"SERVER_NAME": "testserver", "SERVER_PORT": "80"}
+    request.session = FakeSession()
+    return request
+
+
+@pytest.fixture(scope="session")
+def blog_request():
+    """Build a GET request with an empty dict-backed session attached."""
+    return make_get_request
+
+
+class LogCalls(list):
+    """(action, context) pairs recorded from a view's log_action."""
+
+    def __init__(self, monkeypatch):
+        super().__init__()
+        self._monkeypatch = monkeypatch
+
+    def attach(self, view_cls):
+        def capture(view, action, request, **context):
+            self.append((action, context))
+
+        self._monkeypatch.setattr(view_cls, "log_action", capture)
+
+
+@pytest.fixture
+def log_capture(monkeypatch):
+    """Record log_action calls; ``log_capture.attach(views.BlogPostView)``."""
+    return LogCalls(monkeypatch)
+
+
+@pytest.fixture(scope="session")
+def rendered_post():
+    """Render each blog post once per session for read-only assertions.
+
+    Tests that monkeypatch the view or inspect logging must call the view
+    themselves instead.
+    """
+    from tracker import views
+
+    blog_post_view = views.BlogPostView.as_view()
+    responses = {}
+
+    def get(slug):
+        if slug not in responses:
+            request = make_get_request(f"/blog/{slug}/")
+            responses[slug] = blog_post_view(request, slug=slug)
+        return responses[slug]
+
+    return get
+
+
+@pytest.fixture(autouse=True)
+def no_remote_amiibo_api(request, monkeypatch):
+    """Keep views off amiiboapi.org unless a test opts in.
+
+    Tests that need specific remote data still patch _fetch_remote_amiibos on
+    the view class, which takes precedence over this mixin-level stub. Mark a
+    test with ``@pytest.mark.real_remote_fetch`` to exercise the fetch and
+    caching logic against a session the test stubs itself.
+    """
+    if request.node.get_closest_marker("real_remote_fetch"):
+        return
+    monkeypatch.setattr(
+        AmiiboRemoteFetchMixin, "_fetch_remote_amiibos", lambda self: []
+    )
+
+
 @pytest.fixture(autouse=True)
 def clear_caches():
     from django.core.cache import cache
@@ -40,8 +131,10 @@ def clear_caches():
     # counts bleed across tests and later requests get rejected with HTTP 429.
     GoogleSheetClientManager._spreadsheet_cache.clear()
     GoogleSheetClientManager._worksheet_cache.clear()
+    GoogleSheetClientManager._refreshing_spreadsheets.clear()
     cache.clear()
     yield
     GoogleSheetClientManager._spreadsheet_cache.clear()
     GoogleSheetClientManager._worksheet_cache.clear()
+    GoogleSheetClientManager._refreshing_spreadsheets.clear()
     cache.clear()
@@ -1,16 +1,10 @@
 import json
 
 import pytest
-from django.test import RequestFactory
 
 from tracker import views
 
 
-@pytest.fixture
-def rf():
-    return RequestFactory()
-
-
 def test_filters_by_name_and_game_series(monkeypatch, rf):
     local_data = {
         "amiibo": [
@@ -136,3 +130,83 @@ def test_logs_missing_remote_items(monkeypatch, rf):
         call[0] == "amiibo-database-missing-items" and call[1]["missing_count"] == 1
         for call in log_calls
     )
+
+
+@pytest.mark.real_remote_fetch
+def test_remote_catalogue_is_cached_and_revalidated_with_etag(monkeypatch):
+    from django.core.cache import cache
+
+    from tracker import helpers
+
+    class FakeResponse:
+        def __init__(self, status_code, payload=None, etag=None):
+            self.status_code = status_code
+            self._payload = payload
+            self.headers = {"ETag": etag} if etag else {}
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return self._payload
+
+    calls = []
+    responses = [
+        FakeResponse(200, {"amiibo": [{"name": "Mario"}]}, etag='"v1"'),
+        FakeResponse(304),
+    ]
+
+    def fake_get(url, timeout, headers):
+        calls.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(helpers._AMIIBO_API_SESSION, "get", fake_get)
+    fetcher = views.AmiiboDatabaseView()
+
+    assert fetcher._fetch_remote_amiibos() == [{"name": "Mario"}]
+    assert fetcher._fetch_remote_amiibos() == [{"name": "Mario"}]
+    assert calls == [{}]
+
+    key = helpers.AmiiboRemoteFetchMixin._REMOTE_AMIIBO_CACHE_KEY
+    entry = cache.get(key)
+    entry["fetched_at"] -= helpers.AmiiboRemoteFetchMixin._REMOTE_AMIIBO_FRESH_FOR
+    cache.set(key, entry)
+    assert fetcher._fetch_remote_amiibos() == [{"name": "Mario"}]
+    assert calls == [{}, {"If-None-Match": '"v1"'}]
+
+
+@pytest.mark.real_remote_fetch
+def test_remote_catalogue_outage_backs_off_with_stale_copy(monkeypatch):
+    import requests
+    from django.core.cache import cache
+
+    from tracker import helpers
+
+    calls = []
+
+    def failing_get(url, timeout, headers):
+        calls.append(headers)
+        raise requests.ConnectionError("down")
+
+    mixin = helpers.AmiiboRemoteFetchMixin
+    cache.set(
+        mixin._REMOTE_AMIIBO_CACHE_KEY,
+        {"amiibos": [{"name": "Mario"}], "etag": '"v1"', "fetched_at": 0},
+        mixin._REMOTE_AMIIBO_CACHE_TIMEOUT,
+    )
+    monkeypatch.setattr(helpers._AMIIBO_API_SESSION, "get", failing_get)
+    fetcher = views.AmiiboDatabaseView()
+
+    assert fetcher._fetch_remote_amiibos() == [{"name": "Mario"}]
+    assert fetcher._fetch_remote_amiibos() == [{"name": "Mario"}]
+    assert calls == [{"If-None-Match": '"v1"'}]
+    assert cache.get(mixin._REMOTE_AMIIBO_CACHE_KEY)["etag"] == '"v1"'
+
+
+def test_remote_catalogue_retries_ignore_retry_after():
+    from tracker import helpers
+
+    retries = helpers._AMIIBO_API_SESSION.get_adapter("https://").max_retries
+    assert retries.respect_retry_after_header is False
+    assert retries.connect == 0
+    assert retries.read == 0
@@ -1,123 +1,91 @@
 import pytest
 import json
+import re
 from pathlib import Path
-from django.test import RequestFactory
 from django.http import Http404
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import mock_open
 
 from tracker import pricing, views
-from tracker.views import BLOG_POSTS
 
+# as_view() instantiates the class on every call, so patched class attributes
+# (log_action, _fetch_local_amiibos) still take effect through these.
+BLOG_LIST_VIEW = views.BlogListView.as_view()
+BLOG_POST_VIEW = views.BlogPostView.as_view()
+AMIIBO_DETAIL_VIEW = views.AmiiboDetailView.as_view()
 
-@pytest.fixture
-def rf():
-    return RequestFactory()
-
-
-def add_session_to_request(request):
-    """Add mocked session support to a request created by RequestFactory"""
-    request.session = Mock()
-    request.session.get = Mock(return_value=None)
-    return request
-
-
-class TestBlogListView:
-    """Tests for the BlogListView endpoint (GET /blog/)"""
-
-    def test_blog_list_returns_200(self, rf):
-        """Test that blog list view returns 200 status code"""
-        request = add_session_to_request(rf.get("/blog/"))
-        response = views.BlogListView.as_view()(request)
-
-        assert response.status_code == 200
-
-    def test_blog_list_logs_action(self, monkeypatch, rf):
-        """Test that blog list view logs the action"""
-        log_calls = []
+# Assertions search the raw response bytes rather than decoding them first.
+RELEASE_DATE_RE = re.compile(rb"November|2014")
+TEMPLATE_DESCRIPTION_RE = re.compile(rb"Super Mario|character from")
+GENERIC_DESCRIPTION_RE = re.compile(rb"Nintendo|(?i:amiibo)")
 
-        def capture_log(self, action, request, **context):
-            log_calls.append((action, context))
 
-        monkeypatch.setattr(views.BlogListView, "log_action", capture_log)
+def assert_in_response(response, *needles):
+    data = response.content
+    for needle in needles:
+        assert needle.encode() in data, needle
 
-        request = add_session_to_request(rf.get("/blog/"))
-        views.BlogListView.as_view()(request)
 
-        assert len(log_calls) == 1
-        assert log_calls[0][0] == "blog-list-view"
-        assert log_calls[0][1]["total_posts"] == len(views.load_blog_posts())
+# Tests for the BlogListView endpoint (GET /blog/)
+def test_blog_list_returns_200(blog_request):
+    """Test that blog list view returns 200 status code"""
+    request = blog_request("/blog/")
+    response = BLOG_LIST_VIEW(request)
 
+    assert response.status_code == 200
 
-class TestBlogPostView:
-    """Tests for the BlogPostView endpoint (GET /blog/<slug>/)"""
 
-    def test_blog_post_how_it_works_returns_200(self, rf):
-        """Test that 'how-it-works' post returns 200"""
-        request = add_session_to_request(rf.get("/blog/how-it-works/"))
-        response = views.BlogPostView.as_view()(request, slug="how-it-works")
+def test_blog_list_logs_action(log_capture, blog_request):
+    """Test that blog list view logs the action"""
+    request = blog_request("/blog/")
+    log_capture.attach(views.BlogListView)
+    BLOG_LIST_VIEW(request)
 
-        assert response.status_code == 200
+    assert len(log_capture) == 1
+    assert log_capture[0][0] == "blog-list-view"
+    assert log_capture[0][1]["total_posts"] == len(views.load_blog_posts())
 
-    def test_blog_post_pronunciation_returns_200(self, rf):
-        """Test that 'pronunciation' post returns 200"""
-        request = add_session_to_request(rf.get("/blog/pronunciation/"))
-        response = views.BlogPostView.as_view()(request, slug="pronunciation")
 
-        assert response.status_code == 200
+# Tests for the BlogPostView endpoint (GET /blog/<slug>/)
+@pytest.mark.parametrize("slug", ["how-it-works", "pronunciation", "history-of-amiibo"])
+def test_blog_post_returns_200(rendered_post, slug):
+    """Test that known blog posts return 200"""
+    assert rendered_post(slug).status_code == 200
 
-    def test_blog_post_history_returns_200(self, rf):
-        """Test that 'history-of-amiibo' post returns 200"""
-        request = add_session_to_request(rf.get("/blog/history-of-amiibo/"))
-        response = views.BlogPostView.as_view()(request, slug="history-of-amiibo")
 
-        assert response.status_code == 200
+def test_blog_post_invalid_slug_raises_404(blog_request):
+    """Test that invalid slug raises 404"""
+    request = blog_request("/blog/nonexistent/")
 
-    def test_blog_post_invalid_slug_raises_404(self, rf):
-        """Test that invalid slug raises 404"""
-        request = add_session_to_request(rf.get("/blog/nonexistent/"))
+    with pytest.raises(Http404):
+        BLOG_POST_VIEW(request, slug="nonexistent")
 
-        with pytest.raises(Http404):
-            views.BlogPostView.as_view()(request, slug="nonexistent")
 
-    def test_blog_post_logs_action(self, monkeypatch, rf):
-        """Test that blog post view logs the action"""
-        log_calls = []
+def test_blog_post_logs_action(log_capture, blog_request):
+    """Test that blog post view logs the action"""
+    request = blog_request("/blog/pronunciation/")
+    log_capture.attach(views.BlogPostView)
+    BLOG_POST_VIEW(request, slug="pronunciation")
 
-        def capture_log(self, action, request, **context):
-            log_calls.append((action, context))
+    # Should have one log call for successful view
+    view_logs = [call for call in log_capture if call[0] == "blog-post-view"]
+    assert len(view_logs) == 1
+    assert view_logs[0][1]["slug"] == "pronunciation"
+    assert view_logs[0][1]["title"] == "How to Pronounce Amiibo"
 
-        monkeypatch.setattr(views.BlogPostView, "log_action", capture_log)
 
-        request = add_session_to_request(rf.get("/blog/pronunciation/"))
-        views.BlogPostView.as_view()(request, slug="pronunciation")
+def test_blog_post_logs_404(log_capture, blog_request):
+    """Test that 404 is logged when post not found"""
+    request = blog_request("/blog/nonexistent/")
 
-        # Should have one log call for successful view
-        view_logs = [call for call in log_calls if call[0] == "blog-post-view"]
-        assert len(view_logs) == 1
-        assert view_logs[0][1]["slug"] == "pronunciation"
-        assert view_logs[0][1]["title"] == "How to Pronounce Amiibo"
+    log_capture.attach(views.BlogPostView)
+    with pytest.raises(Http404):
+        BLOG_POST_VIEW(request, slug="nonexistent")
 
-    def test_blog_post_logs_404(self, monkeypatch, rf):
-        """Test that 404 is logged when post not found"""
-        log_calls = []
-
-        def capture_log(self, action, request, **context):
-            log_calls.append((action, context))
-
-        monkeypatch.setattr(views.BlogPostView, "log_action", capture_log)
-
-        request = add_session_to_request(rf.get("/blog/nonexistent/"))
-
-        with pytest.raises(Http404):
-            views.BlogPostView.as_view()(request, slug="nonexistent")
-
-        # Should have log call for 404
-        not_found_logs = [
-            call for call in log_calls if call[0] == "blog-post-not-found"
-        ]
-        assert len(not_found_logs) == 1
-        assert not_found_logs[0][1]["slug"] == "nonexistent"
-        assert not_found_logs[0][1]["level"] == "warning"
+    # Should have log call for 404
+    not_found_logs = [call for call in log_capture if call[0] == "blog-post-not-found"]
+    assert len(not_found_logs) == 1
+    assert not_found_logs[0][1]["slug"] == "nonexistent"
+    assert not_found_logs[0][1]["level"] == "warning"
 
 
 # NOTE: TestBlogPostViewDynamicContent and TestBlogPostViewPagination classes were removed
@@ -125,375 +93,260 @@ class TestBlogPostView:
 # Tests for Amiibodex functionality should be added in a separate test_amiibodex_views.py file.
 
 
-class TestAmiiboDetailView:
-    """Tests for the AmiiboDetailView endpoint (GET /blog/number-released/amiibo/<amiibo_id>/)"""
+@pytest.fixture(scope="module")
+def mock_mario():
+    """Mario record shared by the detail tests; patch in copies, the view mutates it."""
+    return {
+        "name": "Mario",
+        "head": "00000000",
+        "tail": "00000002",
+        "character": "Mario",
+        "gameSeries": "Super Mario",
+        "amiiboSeries": "Super Smash Bros.",
+        "type": "Figure",
+        "image": "http://example.com/mario.png",
+        "release": {"na": "2014-11-21"},
+    }
+
+
+# Single-record datasets for the detail tests, built once at import;
+# patch_fetch copies each record before the view sees it.
+REGIONAL_RELEASE_AMIIBOS = (
+    {
+        "name": "Mario",
+        "head": "00000000",
+        "tail": "00000002",
+        "character": "Mario",
+        "gameSeries": "Super Mario",
+        "amiiboSeries": "Super Smash Bros.",
+        "type": "Figure",
+        "image": "http://example.com/mario.png",
+        "release": {
+            "na": "2014-11-21",
+            "jp": "2014-12-06",
+            "eu": "2014-11-28",
+            "au": "2014-11-29",
+        },
+    },
+)
+
+UNKNOWN_CHARACTER_AMIIBOS = (
+    {
+        "name": "Unknown Character",
+        "head": "00000000",
+        "tail": "00000099",
+        "character": "Unknown",
+        "gameSeries": "Test Series",
+        "type": "Figure",
+        "image": "http://example.com/unknown.png",
+        "release": {"na": "2014-11-21"},
+    },
+)
+
+NAMELESS_CHARACTER_AMIIBOS = (
+    {
+        "name": "Test Amiibo",
+        "head": "00000000",
+        "tail": "00000099",
+        "character": "",
+        "gameSeries": "",
+        "type": "Figure",
+        "image": "http://example.com/test.png",
+        "release": {"na": "2014-11-21"},
+    },
+)
 
-    def test_amiibo_detail_returns_200(self, monkeypatch, rf):
-        """Test that amiibo detail view returns 200 for valid amiibo"""
-        mock_amiibos = [
-            {
-                "name": "Mario",
-                "head": "00000000",
-                "tail": "00000002",
-                "character": "Mario",
-                "gameSeries": "Super Mario",
-                "amiiboSeries": "Super Smash Bros.",
-                "type": "Figure",
-                "image": "http://example.com/mario.png",
-                "release": {"na": "2014-11-21", "jp": "2014-12-06"},
-            }
-        ]
 
+@pytest.fixture
+def patch_fetch(monkeypatch):
+    """Serve copies of the given records from _fetch_local_amiibos."""
+
+    def _apply(amiibos, view=views.AmiiboDetailView):
         monkeypatch.setattr(
-            views.AmiiboDetailView,
-            "_fetch_local_amiibos",
-            lambda self: mock_amiibos,
+            view, "_fetch_local_amiibos", lambda self: [dict(a) for a in amiibos]
         )
 
-        request = add_session_to_request(
-            rf.get("/blog/number-released/amiibo/00000000-00000002/")
-        )
-        response = views.AmiiboDetailView.as_view()(
-            request, amiibo_id="00000000-00000002"
-        )
+    return _apply
 
-        assert response.status_code == 200
 
-    def test_amiibo_detail_invalid_id_format_raises_404(self, rf):
-        """Test that invalid amiibo_id format raises 404"""
-        request = add_session_to_request(
-            rf.get("/blog/number-released/amiibo/invalid/")
-        )
+# Tests for the AmiiboDetailView endpoint (GET /blog/number-released/amiibo/<amiibo_id>/)
+def test_amiibo_detail_returns_200(patch_fetch, blog_request, mock_mario):
+    """Test that amiibo detail view returns 200 for valid amiibo"""
+    patch_fetch([mock_mario])
 
-        with pytest.raises(Http404):
-            views.AmiiboDetailView.as_view()(request, amiibo_id="invalid")
+    request = blog_request("/blog/number-released/amiibo/00000000-00000002/")
+    response = AMIIBO_DETAIL_VIEW(request, amiibo_id="00000000-00000002")
 
-    def test_amiibo_detail_short_id_raises_404(self, rf):
-        """Test that short amiibo_id raises 404"""
-        request = add_session_to_request(
-            rf.get("/blog/number-released/amiibo/123-456/")
-        )
+    assert response.status_code == 200
 
-        with pytest.raises(Http404):
-            views.AmiiboDetailView.as_view()(request, amiibo_id="123-456")
 
-    def test_amiibo_detail_not_found_raises_404(self, monkeypatch, rf):
-        """Test that non-existent amiibo raises 404"""
-        mock_amiibos = [
-            {
-                "name": "Mario",
-                "head": "00000000",
-                "tail": "00000002",
-                "release": {"na": "2014-11-21"},
-            }
-        ]
+@pytest.mark.parametrize("amiibo_id", ["invalid", "123-456"])
+def test_amiibo_detail_malformed_id_raises_404(blog_request, amiibo_id):
+    """Test that a malformed or too-short amiibo_id raises 404"""
+    request = blog_request(f"/blog/number-released/amiibo/{amiibo_id}/")
 
-        monkeypatch.setattr(
-            views.AmiiboDetailView,
-            "_fetch_local_amiibos",
-            lambda self: mock_amiibos,
-        )
+    with pytest.raises(Http404):
+        AMIIBO_DETAIL_VIEW(request, amiibo_id=amiibo_id)
 
-        request = add_session_to_request(
-            rf.get("/blog/number-released/amiibo/99999999-99999999/")
-        )
 
-        with pytest.raises(Http404):
-            views.AmiiboDetailView.as_view()(request, amiibo_id="99999999-99999999")
+def test_amiibo_detail_not_found_raises_404(patch_fetch, blog_request, mock_mario):
+    """Test that non-existent amiibo raises 404"""
+    patch_fetch([mock_mario])
 
-    def test_amiibo_detail_logs_view(self, monkeypatch, rf):
-        """Test that amiibo detail view logs the action"""
-        log_calls = []
+    request = blog_request("/blog/number-released/amiibo/99999999-99999999/")
 
-        def capture_log(self, action, request, **context):
-            log_calls.append((action, context))
+    with pytest.raises(Http404):
+        AMIIBO_DETAIL_VIEW(request, amiibo_id="99999999-99999999")
 
-        mock_amiibos = [
-            {
-                "name": "Mario",
-                "head": "00000000",
-                "tail": "00000002",
-                "character": "Mario",
-                "gameSeries": "Super Mario",
-                "release": {"na": "2014-11-21"},
-            }
-        ]
-
-        monkeypatch.setattr(views.AmiiboDetailView, "log_action", capture_log)
-        monkeypatch.setattr(
-            views.AmiiboDetailView,
-            "_fetch_local_amiibos",
-            lambda self: mock_amiibos,
-        )
 
-        request = add_session_to_request(
-            rf.get("/blog/number-released/amiibo/00000000-00000002/")
-        )
-        views.AmiiboDetailView.as_view()(request, amiibo_id="00000000-00000002")
+def test_amiibo_detail_logs_view(log_capture, patch_fetch, blog_request, mock_mario):
+    """Test that amiibo detail view logs the action"""
+    request = blog_request("/blog/number-released/amiibo/00000000-00000002/")
+    patch_fetch([mock_mario])
+    log_capture.attach(views.AmiiboDetailView)
+    AMIIBO_DETAIL_VIEW(request, amiibo_id="00000000-00000002")
 
-        # Check for view log
-        view_logs = [call for call in log_calls if call[0] == "amiibo-detail-view"]
-        assert len(view_logs) == 1
-        assert view_logs[0][1]["amiibo_id"] == "00000000-00000002"
-        assert view_logs[0][1]["amiibo_name"] == "Mario"
+    # Check for view log
+    view_logs = [call for call in log_capture if call[0] == "amiibo-detail-view"]
+    assert len(view_logs) == 1
+    assert view_logs[0][1]["amiibo_id"] == "00000000-00000002"
+    assert view_logs[0][1]["amiibo_name"] == "Mario"
 
-    def test_amiibo_detail_regional_releases(self, monkeypatch, rf):
-        """Test that regional release dates are formatted correctly"""
-        mock_amiibos = [
-            {
-                "name": "Mario",
-                "head": "00000000",
-                "tail": "00000002",
-                "character": "Mario",
-                "gameSeries": "Super Mario",
-                "amiiboSeries": "Super Smash Bros.",
-                "type": "Figure",
-                "image": "http://example.com/mario.png",
-                "release": {
-                    "na": "2014-11-21",
-                    "jp": "2014-12-06",
-                    "eu": "2014-11-28",
-                    "au": "2014-11-29",
-                },
-            }
-        ]
 
-        monkeypatch.setattr(
-            views.AmiiboDetailView,
-            "_fetch_local_amiibos",
-            lambda self: mock_amiibos,
-        )
+def test_amiibo_detail_regional_releases(patch_fetch, blog_request):
+    """Test that regional release dates are formatted correctly"""
+    patch_fetch(REGIONAL_RELEASE_AMIIBOS)
 
-        request = add_session_to_request(
-            rf.get("/blog/number-released/amiibo/00000000-00000002/")
-        )
-        response = views.AmiiboDetailView.as_view()(
-            request, amiibo_id="00000000-00000002"
-        )
+    request = blog_request("/blog/number-released/amiibo/00000000-00000002/")
+    response = AMIIBO_DETAIL_VIEW(request, amiibo_id="00000000-00000002")
 
-        assert response.status_code == 200
-        # Check that regional release dates appear in rendered HTML
-        content = response.content.decode("utf-8")
-        assert "North America" in content
-        assert "November" in content or "2014" in content
+    assert response.status_code == 200
+    # Check that regional release dates appear in rendered HTML
+    assert_in_response(response, "North America")
+    assert RELEASE_DATE_RE.search(response.content)
 
-    def test_amiibo_detail_renders_price_chart(self, monkeypatch, rf):
-        """Test that amiibo detail pages render current prices and chart data."""
-        mock_amiibos = [
+
+def test_amiibo_detail_renders_price_chart(
+    monkeypatch, patch_fetch, blog_request, mock_mario
+):
+    """Test that amiibo detail pages render current prices and chart data."""
+    display = pricing.normalize_pricing_for_display(
+        mock_mario,
+        {
+            "currency": "USD",
+            "loose_estimate_cents": 1800,
+            "new_estimate_cents": 5000,
+            "sample_count": 6,
+            "confidence": "medium",
+            "source_url": "https://www.ebay.com/sch/i.html?_nkw=Mario+amiibo",
+            "snapshot_date": "2026-06-28",
+        },
+    )
+    chart = pricing.build_price_chart_data(
+        display,
+        [
             {
-                "name": "Mario",
-                "head": "00000000",
-                "tail": "00000002",
-                "character": "Mario",
-                "gameSeries": "Super Mario",
-                "amiiboSeries": "Super Smash Bros.",
-                "type": "Figure",
-                "image": "http://example.com/mario.png",
-                "release": {"na": "2014-11-21"},
-            }
-        ]
-        display = pricing.normalize_pricing_for_display(
-            mock_amiibos[0],
+                "snapshot_date": "2026-06-27",
+                "currency": "USD",
+                "loose_estimate_cents": 1600,
+                "new_estimate_cents": 4600,
+            },
             {
+                "snapshot_date": "2026-06-28",
                 "currency": "USD",
                 "loose_estimate_cents": 1800,
                 "new_estimate_cents": 5000,
-                "sample_count": 6,
-                "confidence": "medium",
-                "source_url": "https://www.ebay.com/sch/i.html?_nkw=Mario+amiibo",
-                "snapshot_date": "2026-06-28",
             },
-        )
-        chart = pricing.build_price_chart_data(
-            display,
-            [
-                {
-                    "snapshot_date": "2026-06-27",
-                    "currency": "USD",
-                    "loose_estimate_cents": 1600,
-                    "new_estimate_cents": 4600,
-                },
-                {
-                    "snapshot_date": "2026-06-28",
-                    "currency": "USD",
-                    "loose_estimate_cents": 1800,
-                    "new_estimate_cents": 5000,
-                },
-            ],
-        )
+        ],
+    )
+
+    patch_fetch([mock_mario])
+    monkeypatch.setattr(
+        views,
+        "get_amiibo_pricing_context",
+        lambda amiibo: {"pricing": display, "price_chart": chart},
+    )
+
+    request = blog_request("/blog/number-released/amiibo/00000000-00000002/")
+    response = AMIIBO_DETAIL_VIEW(request, amiibo_id="00000000-00000002")
+
+    assert response.status_code == 200
+    assert_in_response(
+        response,
+        "Price Chart",
+        "$18",
+        "$50",
+        "Marketplace Snapshot Trend",
+        "price-hit-point",
+        "loosePriceArea",
+        "View eBay listings",
+    )
+
+
+# Tests for character description functionality in AmiiboDetailView
+@pytest.fixture
+def mock_descriptions_file(monkeypatch):
+    """Serve a one-entry character descriptions JSON to the detail view."""
+    descriptions = {"Mario": "Mario is the iconic plumber from Nintendo."}
+    monkeypatch.setattr(Path, "exists", lambda self: True)
+    monkeypatch.setattr("builtins.open", mock_open(read_data=json.dumps(descriptions)))
+    return descriptions
 
-        monkeypatch.setattr(
-            views.AmiiboDetailView,
-            "_fetch_local_amiibos",
-            lambda self: mock_amiibos,
-        )
-        monkeypatch.setattr(
-            views,
-            "get_amiibo_pricing_context",
-            lambda amiibo: {"pricing": display, "price_chart": chart},
-        )
 
-        request = add_session_to_request(
-            rf.get("/blog/number-released/amiibo/00000000-00000002/")
-        )
-        response = views.AmiiboDetailView.as_view()(
-            request, amiibo_id="00000000-00000002"
-        )
-        content = response.content.decode("utf-8")
+def test_get_character_description_from_json(
+    patch_fetch, blog_request, mock_mario, mock_descriptions_file
+):
+    """Test that character descriptions are loaded from JSON file"""
+    patch_fetch([mock_mario])
 
-        assert response.status_code == 200
-        assert "Price Chart" in content
-        assert "$18" in content
-        assert "$50" in content
-        assert "Marketplace Snapshot Trend" in content
-        assert "price-hit-point" in content
-        assert "loosePriceArea" in content
-        assert "View eBay listings" in content
+    request = blog_request("/blog/number-released/amiibo/00000000-00000002/")
+    response = AMIIBO_DETAIL_VIEW(request, amiibo_id="00000000-00000002")
 
+    assert response.status_code == 200
+    # Check description in rendered HTML
+    assert_in_response(response, mock_descriptions_file["Mario"])
 
-class TestCharacterDescriptions:
-    """Tests for character description functionality in AmiiboDetailView"""
 
-    def test_get_character_description_from_json(self, monkeypatch, rf):
-        """Test that character descriptions are loaded from JSON file"""
-        mock_amiibos = [
-            {
-                "name": "Mario",
-                "head": "00000000",
-                "tail": "00000002",
-                "character": "Mario",
-                "gameSeries": "Super Mario",
-                "type": "Figure",
-                "image": "http://example.com/mario.png",
-                "release": {"na": "2014-11-21"},
-            }
-        ]
-
-        mock_descriptions = {"Mario": "Mario is the iconic plumber from Nintendo."}
+def test_get_character_description_template_fallback(
+    monkeypatch, patch_fetch, blog_request
+):
+    """Test that template-based description is used when JSON file doesn't exist"""
+    patch_fetch(UNKNOWN_CHARACTER_AMIIBOS)
 
-        monkeypatch.setattr(
-            views.AmiiboDetailView,
-            "_fetch_local_amiibos",
-            lambda self: mock_amiibos,
-        )
+    # Mock file not existing
+    monkeypatch.setattr(Path, "exists", lambda self: False)
+    request = blog_request("/blog/number-released/amiibo/00000000-00000099/")
+    response = AMIIBO_DETAIL_VIEW(request, amiibo_id="00000000-00000099")
 
-        # Mock the file reading
-        with patch("pathlib.Path.exists", return_value=True):
-            with patch(
-                "builtins.open", mock_open(read_data=json.dumps(mock_descriptions))
-            ):
-                request = add_session_to_request(
-                    rf.get("/blog/number-released/amiibo/00000000-00000002/")
-                )
-                response = views.AmiiboDetailView.as_view()(
-                    request, amiibo_id="00000000-00000002"
-                )
-
-                assert response.status_code == 200
-                # Check description in rendered HTML
-                content = response.content.decode("utf-8")
-                assert "Mario is the iconic plumber from Nintendo" in content
-
-    def test_get_character_description_template_fallback(self, monkeypatch, rf):
-        """Test that template-based description is used when JSON file doesn't exist"""
-        mock_amiibos = [
-            {
-                "name": "Unknown Character",
-                "head": "00000000",
-                "tail": "00000099",
-                "character": "Unknown",
-                "gameSeries": "Test Series",
-                "type": "Figure",
-                "image": "http://example.com/unknown.png",
-                "release": {"na": "2014-11-21"},
-            }
-        ]
+    assert response.status_code == 200
+    # Should use template fallback
+    assert_in_response(response, "Test Series")
 
-        monkeypatch.setattr(
-            views.AmiiboDetailView,
-            "_fetch_local_amiibos",
-            lambda self: mock_amiibos,
-        )
 
-        # Mock file not existing
-        with patch("pathlib.Path.exists", return_value=False):
-            request = add_session_to_request(
-                rf.get("/blog/number-released/amiibo/00000000-00000099/")
-            )
-            response = views.AmiiboDetailView.as_view()(
-                request, amiibo_id="00000000-00000099"
-            )
-
-            assert response.status_code == 200
-            # Should use template fallback
-            content = response.content.decode("utf-8")
-            assert "Test Series" in content
-
-    def test_get_character_description_handles_json_error(self, monkeypatch, rf):
-        """Test that JSON parsing errors fall back to template description"""
-        mock_amiibos = [
-            {
-                "name": "Mario",
-                "head": "00000000",
-                "tail": "00000002",
-                "character": "Mario",
-                "gameSeries": "Super Mario",
-                "type": "Figure",
-                "image": "http://example.com/mario.png",
-                "release": {"na": "2014-11-21"},
-            }
-        ]
+def test_get_character_description_handles_json_error(
+    monkeypatch, patch_fetch, blog_request, mock_mario
+):
+    """Test that JSON parsing errors fall back to template description"""
+    patch_fetch([mock_mario])
 
-        monkeypatch.setattr(
-            views.AmiiboDetailView,
-            "_fetch_local_amiibos",
-            lambda self: mock_amiibos,
-        )
+    # Mock file exists but has invalid JSON
+    monkeypatch.setattr(Path, "exists", lambda self: True)
+    monkeypatch.setattr("builtins.open", mock_open(read_data="invalid json {"))
+    request = blog_request("/blog/number-released/amiibo/00000000-00000002/")
+    response = AMIIBO_DETAIL_VIEW(request, amiibo_id="00000000-00000002")
 
-        # Mock file exists but has invalid JSON
-        with patch("pathlib.Path.exists", return_value=True):
-            with patch("builtins.open", mock_open(read_data="invalid json {")):
-                request = add_session_to_request(
-                    rf.get("/blog/number-released/amiibo/00000000-00000002/")
-                )
-                response = views.AmiiboDetailView.as_view()(
-                    request, amiibo_id="00000000-00000002"
-                )
-
-                assert response.status_code == 200
-                # Should fall back to template
-                content = response.content.decode("utf-8")
-                assert "Super Mario" in content or "character from" in content
-
-    def test_get_character_description_no_character_name(self, monkeypatch, rf):
-        """Test description when character name is missing"""
-        mock_amiibos = [
-            {
-                "name": "Test Amiibo",
-                "head": "00000000",
-                "tail": "00000099",
-                "character": "",
-                "gameSeries": "",
-                "type": "Figure",
-                "image": "http://example.com/test.png",
-                "release": {"na": "2014-11-21"},
-            }
-        ]
+    assert response.status_code == 200
+    # Should fall back to template
+    assert TEMPLATE_DESCRIPTION_RE.search(response.content)
 
-        monkeypatch.setattr(
-            views.AmiiboDetailView,
-            "_fetch_local_amiibos",
-            lambda self: mock_amiibos,
-        )
 
-        request = add_session_to_request(
-            rf.get("/blog/number-released/amiibo/00000000-00000099/")
-        )
-        response = views.AmiiboDetailView.as_view()(
-            request, amiibo_id="00000000-00000099"
-        )
+def test_get_character_description_no_character_name(patch_fetch, blog_request):
+    """Test description when character name is missing"""
+    patch_fetch(NAMELESS_CHARACTER_AMIIBOS)
+
+    request = blog_request("/blog/number-released/amiibo/00000000-00000099/")
+    response = AMIIBO_DETAIL_VIEW(request, amiibo_id="00000000-00000099")
 
-        assert response.status_code == 200
-        # Should use generic fallback
-        content = response.content.decode("utf-8")
-        assert "Nintendo" in content or "amiibo" in content.lower()
+    assert response.status_code == 200
+    # Should use generic fallback
+    assert GENERIC_DESCRIPTION_RE.search(response.content)
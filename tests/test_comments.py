@@ -1,18 +1,12 @@
 import pytest
 from django.core.cache import cache
 from django.http import Http404
-from django.test import RequestFactory
 
 from google.api_core.exceptions import ResourceExhausted
 
 from tracker import comments, views
 
 
-@pytest.fixture
-def rf():
-    return RequestFactory()
-
-
 @pytest.fixture(autouse=True)
 def clear_cache():
     cache.clear()
@@ -3,7 +3,9 @@ import json
 import gspread
 import pytest
 import requests
+from gspread.http_client import HTTPClient
 
+from tracker.exceptions import QuotaExceededError, SpreadsheetNotFoundError
 from tracker.google_sheet_client_manager import GoogleSheetClientManager
 
 
@@ -15,28 +17,32 @@ class DummyWorksheet:
     def append_row(self, row):
         self.rows.append(row)
 
+    def update(self, values, range_name=None, value_input_option=None):
+        del range_name, value_input_option  # unused in dummy implementation
+        self.rows.extend(values)
+
 
 class DummySpreadsheet:
     def __init__(self, sheet_id="dummy-sheet-id"):
         self.id = sheet_id
-        self.worksheets = {}
+        self.sheets = {}
 
     def worksheet(self, name):
-        if name not in self.worksheets:
+        if name not in self.sheets:
             raise gspread.exceptions.WorksheetNotFound
-        return self.worksheets[name]
+        return self.sheets[name]
 
     def add_worksheet(self, title, rows, cols):
         del rows, cols  # unused in dummy implementation
         worksheet = DummyWorksheet(title)
-        self.worksheets[title] = worksheet
+        self.sheets[title] = worksheet
         return worksheet
 
     def del_worksheet(self, worksheet):
-        self.worksheets.pop(worksheet.title, None)
+        self.sheets.pop(worksheet.title, None)
 
-    def worksheets_list(self):
-        return list(self.worksheets.values())
+    def worksheets(self):
+        return list(self.sheets.values())
 
 
 @pytest.fixture(autouse=True)
@@ -58,6 +64,8 @@ def test_client_secret_path_writes_inline_secret(tmp_path, monkeypatch):
     assert path == str(secret_file)
     assert secret_file.exists()
     assert json.loads(secret_file.read_text()) == inline_secret
+    # Written via a temp file and renamed; nothing is left beside it.
+    assert list(tmp_path.iterdir()) == [secret_file]
 
 
 def test_get_or_create_worksheet_by_name_creates_defaults():
@@ -90,6 +98,75 @@ def test_get_or_create_worksheet_by_name_creates_defaults():
     assert manager.get_or_create_worksheet_by_name("AmiiboCollection") is amiibo_sheet
 
 
+class BatchSpreadsheet:
+    """Spreadsheet double that answers batch_update like the Sheets API."""
+
+    id = "batch-sheet-id"
+    client = object.__new__(HTTPClient)
+
+    def __init__(self, existing=()):
+        self.existing = list(existing)
+        self.bodies = []
+
+    def worksheets(self):
+        return self.existing
+
+    def batch_update(self, body):
+        self.bodies.append(body)
+        return {
+            "replies": [
+                (
+                    {"addSheet": {"properties": request["addSheet"]["properties"]}}
+                    if "addSheet" in request
+                    else {}
+                )
+                for request in body["requests"]
+            ]
+        }
+
+
+def test_default_worksheets_are_provisioned_in_one_batch_update():
+    manager = GoogleSheetClientManager()
+    default_sheet = DummyWorksheet("Sheet1")
+    default_sheet.id = 0
+    spreadsheet = BatchSpreadsheet(existing=[default_sheet])
+
+    manager._initialize_default_worksheets(spreadsheet)
+
+    assert len(spreadsheet.bodies) == 1
+    requests_body = spreadsheet.bodies[0]["requests"]
+    assert [next(iter(request)) for request in requests_body] == [
+        "addSheet",
+        "updateCells",
+        "addSheet",
+        "updateCells",
+        "deleteSheet",
+    ]
+    assert requests_body[-1] == {"deleteSheet": {"sheetId": 0}}
+    config_add, config_cells = requests_body[2], requests_body[3]
+    assert config_add["addSheet"]["properties"]["title"] == (
+        manager.work_sheet_config_manager
+    )
+    assert (
+        config_cells["updateCells"]["start"]["sheetId"]
+        == config_add["addSheet"]["properties"]["sheetId"]
+    )
+    assert [
+        [cell["userEnteredValue"]["stringValue"] for cell in row["values"]]
+        for row in config_cells["updateCells"]["rows"]
+    ] == [
+        ["Config name", "Config value"],
+        ["DarkMode", "0"],
+        ["IgnoreType:Band", "1"],
+        ["IgnoreType:Card", "1"],
+        ["IgnoreType:Yarn", "1"],
+    ]
+    config_sheet = manager._get_or_create_worksheet(
+        spreadsheet, manager.work_sheet_config_manager
+    )
+    assert config_sheet.title == manager.work_sheet_config_manager
+
+
 def test_open_or_create_spreadsheet_reuses_existing():
     existing_spreadsheet = object()
 
@@ -188,16 +265,16 @@ def test_initialize_default_worksheets_populates_missing():
 def test_initialize_default_worksheets_respects_existing_data():
     manager = GoogleSheetClientManager()
     spreadsheet = DummySpreadsheet()
-    spreadsheet.worksheets[manager.work_sheet_amiibo_manager] = DummyWorksheet(
+    spreadsheet.sheets[manager.work_sheet_amiibo_manager] = DummyWorksheet(
         manager.work_sheet_amiibo_manager
     )
-    spreadsheet.worksheets[manager.work_sheet_amiibo_manager].rows.append([
+    spreadsheet.sheets[manager.work_sheet_amiibo_manager].rows.append([
         "custom",
     ])
-    spreadsheet.worksheets[manager.work_sheet_config_manager] = DummyWorksheet(
+    spreadsheet.sheets[manager.work_sheet_config_manager] = DummyWorksheet(
         manager.work_sheet_config_manager
     )
-    spreadsheet.worksheets[manager.work_sheet_config_manager].rows.append([
+    spreadsheet.sheets[manager.work_sheet_config_manager].rows.append([
         "config",
     ])
 
@@ -207,15 +284,51 @@ def test_initialize_default_worksheets_respects_existing_data():
     assert spreadsheet.worksheet(manager.work_sheet_config_manager).rows == [["config"]]
 
 
+def test_initialize_default_worksheets_lists_sheets_once():
+    manager = GoogleSheetClientManager()
+    spreadsheet = DummySpreadsheet(sheet_id="listed-once")
+    spreadsheet.sheets["Sheet1"] = DummyWorksheet("Sheet1")
+
+    def fail_lookup(name):  # pragma: no cover - fails if a per-name lookup happens
+        raise AssertionError(f"unexpected worksheet lookup for {name}")
+
+    spreadsheet.worksheet = fail_lookup
+
+    manager._initialize_default_worksheets(spreadsheet)
+
+    assert set(spreadsheet.sheets.keys()) == {
+        manager.work_sheet_amiibo_manager,
+        manager.work_sheet_config_manager,
+    }
+
+
+def test_worksheet_cache_miss_resolves_every_tab_in_one_listing():
+    manager = GoogleSheetClientManager()
+    spreadsheet = DummySpreadsheet(sheet_id="one-listing")
+    for title in (manager.work_sheet_amiibo_manager, manager.work_sheet_config_manager):
+        spreadsheet.sheets[title] = DummyWorksheet(title)
+    listings = []
+    list_worksheets = spreadsheet.worksheets
+    spreadsheet.worksheets = lambda: listings.append(1) or list_worksheets()
+    manager.__dict__["spreadsheet"] = spreadsheet
+
+    amiibo = manager.get_or_create_worksheet_by_name(manager.work_sheet_amiibo_manager)
+    config = manager.get_or_create_worksheet_by_name(manager.work_sheet_config_manager)
+
+    assert amiibo.title == manager.work_sheet_amiibo_manager
+    assert config.title == manager.work_sheet_config_manager
+    assert len(listings) == 1
+
+
 def test_default_sheet_is_removed_after_initialization():
     manager = GoogleSheetClientManager()
     spreadsheet = DummySpreadsheet()
-    spreadsheet.worksheets["Sheet1"] = DummyWorksheet("Sheet1")
+    spreadsheet.sheets["Sheet1"] = DummyWorksheet("Sheet1")
 
     manager._initialize_default_worksheets(spreadsheet)
 
-    assert "Sheet1" not in spreadsheet.worksheets
-    assert set(spreadsheet.worksheets.keys()) == {
+    assert "Sheet1" not in spreadsheet.sheets
+    assert set(spreadsheet.sheets.keys()) == {
         manager.work_sheet_amiibo_manager,
         manager.work_sheet_config_manager,
     }
@@ -244,10 +357,10 @@ def test_spreadsheet_cache_reused_between_instances():
 def test_get_or_create_worksheet_uses_cache():
     manager = GoogleSheetClientManager()
     spreadsheet = DummySpreadsheet(sheet_id="cache-me")
-    spreadsheet.worksheets["Existing"] = DummyWorksheet("Existing")
+    spreadsheet.sheets["Existing"] = DummyWorksheet("Existing")
 
     first = manager._get_or_create_worksheet(spreadsheet, "Existing")
-    assert first is spreadsheet.worksheets["Existing"]
+    assert first is spreadsheet.sheets["Existing"]
 
     def fail_lookup(name):  # pragma: no cover - fails if cache misses
         raise AssertionError(f"unexpected worksheet lookup for {name}")
@@ -258,3 +371,205 @@ def test_get_or_create_worksheet_uses_cache():
     cached = second_manager._get_or_create_worksheet(spreadsheet, "Existing")
 
     assert cached is first
+
+
+def test_oauth_clients_share_one_https_connection_pool():
+    creds_json = {
+        "token": "token",
+        "refresh_token": "refresh",
+        "client_id": "client",
+        "client_secret": "secret",
+    }
+    first = GoogleSheetClientManager(creds_json=creds_json).client
+    second = GoogleSheetClientManager(creds_json=creds_json).client
+
+    url = "https://sheets.googleapis.com"
+    assert first.http_client.session is not second.http_client.session
+    assert first.http_client.session.get_adapter(
+        url
+    ) is second.http_client.session.get_adapter(url)
+
+
+def test_stale_spreadsheet_is_served_while_refreshing(monkeypatch):
+    from tracker import google_sheet_client_manager as module
+
+    class InlineExecutor:
+        def submit(self, fn):
+            fn()
+
+    class ReopeningClient:
+        def open_by_key(self, key):
+            assert key == "sheet-id"
+            return fresh_sheet
+
+    stale_sheet = DummySpreadsheet("sheet-id")
+    fresh_sheet = DummySpreadsheet("sheet-id")
+    monkeypatch.setattr(module, "_REFRESH_EXECUTOR", InlineExecutor())
+    monkeypatch.setattr(module.time, "monotonic", lambda: 10_000.0)
+    monkeypatch.setattr(
+        GoogleSheetClientManager, "client", property(lambda self: ReopeningClient())
+    )
+
+    manager = GoogleSheetClientManager(creds_json={"refresh_token": "user"})
+    manager._open_or_create_spreadsheet = lambda: pytest.fail("refresh must not create")
+    cache_key = manager._spreadsheet_cache_key()
+    stale_at = 10_000.0 - GoogleSheetClientManager.SPREADSHEET_FRESH_FOR - 1
+    GoogleSheetClientManager._spreadsheet_cache[cache_key] = (stale_sheet, stale_at)
+
+    assert manager.spreadsheet is stale_sheet
+    assert GoogleSheetClientManager._spreadsheet_cache[cache_key] == (
+        fresh_sheet,
+        10_000.0,
+    )
+    assert not GoogleSheetClientManager._refreshing_spreadsheets
+
+
+def test_service_account_keyfile_is_parsed_once(monkeypatch):
+    from google.oauth2 import service_account
+
+    from tracker import google_sheet_client_manager as module
+
+    loads = []
+
+    def fake_from_file(path, scopes=None):
+        loads.append(path)
+        return object()
+
+    module._load_service_account.cache_clear()
+    monkeypatch.setattr(
+        service_account.Credentials, "from_service_account_file", fake_from_file
+    )
+    monkeypatch.setattr(GoogleSheetClientManager, "get_creds", lambda self, c: None)
+    monkeypatch.setattr(gspread, "authorize", lambda creds, session=None: creds)
+
+    first = GoogleSheetClientManager(credentials_file="service.json").client
+    second = GoogleSheetClientManager(credentials_file="service.json").client
+    module._load_service_account.cache_clear()
+
+    assert first is second
+    assert loads == ["service.json"]
+
+
+def test_spreadsheet_cache_is_scoped_to_the_user():
+    first_sheet, second_sheet = object(), object()
+
+    first = GoogleSheetClientManager(creds_json={"refresh_token": "user-a"})
+    first._open_or_create_spreadsheet = lambda: first_sheet
+    first._initialize_default_worksheets = lambda spreadsheet: None
+
+    second = GoogleSheetClientManager(creds_json={"refresh_token": "user-b"})
+    second._open_or_create_spreadsheet = lambda: second_sheet
+    second._initialize_default_worksheets = lambda spreadsheet: None
+
+    assert first.spreadsheet is first_sheet
+    assert second.spreadsheet is second_sheet
+
+
+def test_not_found_error_invalidates_cached_spreadsheet():
+    manager = GoogleSheetClientManager(creds_json={"refresh_token": "user-a"})
+    manager._open_or_create_spreadsheet = lambda: DummySpreadsheet()
+    manager._initialize_default_worksheets = lambda spreadsheet: None
+    first = manager.spreadsheet
+
+    def missing():
+        response = requests.Response()
+        response.status_code = 404
+        response._content = json.dumps(
+            {"error": {"code": 404, "message": "not found", "status": "NOT_FOUND"}}
+        ).encode()
+        raise gspread.exceptions.APIError(response)
+
+    with pytest.raises(SpreadsheetNotFoundError):
+        manager.execute_worksheet_operation(missing)
+
+    assert manager.load_spreadsheet() is not first
+
+
+def test_quota_error_keeps_cached_spreadsheet():
+    manager = GoogleSheetClientManager(creds_json={"refresh_token": "user-a"})
+    manager._open_or_create_spreadsheet = lambda: DummySpreadsheet()
+    manager._initialize_default_worksheets = lambda spreadsheet: None
+    first = manager.spreadsheet
+
+    def throttled():
+        response = requests.Response()
+        response.status_code = 403
+        response._content = json.dumps(
+            {
+                "error": {
+                    "code": 403,
+                    "message": "Request had insufficient capacity.",
+                    "errors": [{"reason": "userRateLimitExceeded"}],
+                    "status": "PERMISSION_DENIED",
+                }
+            }
+        ).encode()
+        raise gspread.exceptions.APIError(response)
+
+    with pytest.raises(QuotaExceededError):
+        manager.execute_worksheet_operation(throttled)
+
+    assert manager.load_spreadsheet() is first
+
+
+def test_client_secret_path_skips_rewrite_when_secret_unchanged(tmp_path, monkeypatch):
+    inline_secret = json.dumps({"installed": "client"})
+    secret_file = tmp_path / "client_secret.json"
+    secret_file.write_text(inline_secret, encoding="utf-8")
+    monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_SECRETS_DATA", inline_secret)
+    monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_SECRETS", str(secret_file))
+    monkeypatch.setattr(
+        "tracker.google_sheet_client_manager.os.makedirs",
+        lambda *args, **kwargs: pytest.fail("unchanged secret should not be rewritten"),
+    )
+
+    assert GoogleSheetClientManager.client_secret_path() == str(secret_file)
+    assert GoogleSheetClientManager.client_secret_path() == str(secret_file)
+
+    moved_file = tmp_path / "moved_client_secret.json"
+    moved_file.write_text(inline_secret, encoding="utf-8")
+    monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_SECRETS", str(moved_file))
+    assert GoogleSheetClientManager.client_secret_path() == str(moved_file)
+
+
+def test_client_secret_path_rewrites_only_when_secret_changes(tmp_path, monkeypatch):
+    secret_file = tmp_path / "client_secret.json"
+    monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_SECRETS", str(secret_file))
+    monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_SECRETS_DATA", '{"installed": "v1"}')
+    GoogleSheetClientManager.client_secret_path()
+
+    with monkeypatch.context() as patched:
+        patched.setattr(
+            GoogleSheetClientManager,
+            "_secret_file_matches",
+            lambda *args: pytest.fail("settled secret should not be re-read"),
+        )
+        assert GoogleSheetClientManager.client_secret_path() == str(secret_file)
+
+    monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_SECRETS_DATA", '{"installed": "v2"}')
+    GoogleSheetClientManager.client_secret_path()
+    assert json.loads(secret_file.read_text()) == {"installed": "v2"}
+
+
+def test_worksheet_listing_requests_only_tab_properties():
+    class MetadataSpreadsheet:
+        id = "metadata-sheet-id"
+        client = object.__new__(HTTPClient)
+
+        def __init__(self):
+            self.params = []
+
+        def fetch_sheet_metadata(self, params=None):
+            self.params.append(params)
+            return {
+                "sheets": [
+                    {"properties": {"sheetId": 7, "title": "AmiiboCollection"}},
+                ]
+            }
+
+    spreadsheet = MetadataSpreadsheet()
+    by_title = GoogleSheetClientManager()._worksheets_by_title(spreadsheet)
+
+    assert spreadsheet.params == [{"fields": "sheets.properties"}]
+    assert list(by_title) == ["AmiiboCollection"]
+    assert by_title["AmiiboCollection"].id == 7
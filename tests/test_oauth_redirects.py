@@ -57,7 +57,7 @@ def test_oauth_redirect_uri_for_production_falls_back_from_stale_local_env(monke
 @patch("tracker.views.logout_user")
 @patch("tracker.views.get_active_credentials_json", return_value=None)
 @patch("tracker.views.GoogleSheetClientManager.client_secret_path")
-@patch("tracker.views.Flow")
+@patch("tracker.google_sheet_client_manager.Flow")
 def test_oauth_login_flow_receives_local_redirect_uri(
     mock_flow,
     mock_client_secret_path,
@@ -91,7 +91,7 @@ def test_oauth_login_flow_receives_local_redirect_uri(
 @patch("tracker.views.logout_user")
 @patch("tracker.views.get_active_credentials_json", return_value=None)
 @patch("tracker.views.GoogleSheetClientManager.client_secret_path")
-@patch("tracker.views.Flow")
+@patch("tracker.google_sheet_client_manager.Flow")
 def test_oauth_login_missing_client_secret_redirects_with_setup_error(
     mock_flow,
     mock_client_secret_path,
@@ -113,6 +113,24 @@ def test_oauth_login_missing_client_secret_redirects_with_setup_error(
     assert request.session["oauth_error"]["action_required"] == "oauth_config_required"
 
 
+@patch("tracker.views.GoogleSheetClientManager.client_secret_path")
+@patch("tracker.google_sheet_client_manager.Flow")
+def test_build_oauth_flow_uses_inline_client_config(
+    mock_flow, mock_client_secret_path, monkeypatch
+):
+    monkeypatch.setenv(
+        "GOOGLE_OAUTH_CLIENT_SECRETS_DATA", '{"web": {"client_id": "inline"}}'
+    )
+
+    views.build_oauth_flow(redirect_uri="http://localhost:8000/oauth2callback/")
+
+    assert mock_flow.from_client_config.call_args.args[0] == {
+        "web": {"client_id": "inline"}
+    }
+    mock_flow.from_client_secrets_file.assert_not_called()
+    mock_client_secret_path.assert_not_called()
+
+
 def test_initialize_tracking_sheet_for_login_seeds_public_amiibos(monkeypatch):
     seeded = []
     manager = object()
@@ -160,7 +178,7 @@ def test_initialize_tracking_sheet_for_login_seeds_public_amiibos(monkeypatch):
 @patch("tracker.views.initialize_tracking_sheet_for_login")
 @patch("tracker.views.build_sheet_client_manager")
 @patch("tracker.views.ensure_spreadsheet_session")
-@patch("tracker.views.Flow")
+@patch("tracker.google_sheet_client_manager.Flow")
 @patch("tracker.views.googleapiclient")
 def test_oauth_callback_initializes_tracking_sheet_before_redirect(
     mock_googleapiclient,
@@ -157,6 +157,18 @@ def test_toggle_collected_updates_known_id():
     assert service.sheet.rows[1][5] == "1"
 
 
+def test_toggle_collected_sees_rows_seeded_after_first_lookup():
+    service = build_service()
+    assert service.toggle_collected("existingseriesexistingtail", "collect") is True
+
+    service.seed_new_amiibos(
+        [{"head": "new", "gameSeries": "series", "tail": "tail", "name": "New"}]
+    )
+
+    assert service.toggle_collected("newseriestail", "collect") is True
+    assert service.sheet.rows[2][5] == "1"
+
+
 def test_ensure_sheet_structure_sets_expected_header():
     service = build_service()
     # corrupt header to ensure update is called
@@ -1,14 +1,21 @@
+import hashlib
+import json
 import os
+import random
+import threading
 import time
-from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 
 import gspread
 import requests
+from requests.adapters import HTTPAdapter
 from django.conf import settings
 from google.auth.exceptions import RefreshError
+from google.auth.transport.requests import AuthorizedSession, Request
+from google.oauth2 import service_account
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
-from oauth2client.service_account import ServiceAccountCredentials
 from cachetools import TTLCache
 
 from constants import OauthConstants
@@ -24,36 +31,147 @@ from tracker.exceptions import (
     InsufficientScopesError,
 )
 
+# Rows seeded into freshly created worksheets.
+_AMIIBO_HEADER = (
+    "Amiibo ID",
+    "Amiibo Name",
+    "Game Series",
+    "Release Date",
+    "Type",
+    "Collected Status",
+    "Favorite",
+)
+_CONFIG_ROWS = (
+    ("Config name", "Config value"),
+    ("DarkMode", "0"),
+    ("IgnoreType:Band", "1"),
+    ("IgnoreType:Card", "1"),
+    ("IgnoreType:Yarn", "1"),
+)
+
+# Managers are built per Django request; mounting one adapter on every session
+# keeps HTTPS connections to the Google APIs pooled across them.
+_HTTPS_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+_TOKEN_SESSION = requests.Session()
+_TOKEN_SESSION.mount("https://", _HTTPS_ADAPTER)
+# Runs stale-while-revalidate refreshes of cached spreadsheets.
+_REFRESH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="sheet-refresh"
+)
+
+
+def _authorized_session(credentials) -> AuthorizedSession:
+    session = AuthorizedSession(
+        credentials, auth_request=Request(session=_TOKEN_SESSION)
+    )
+    session.mount("https://", _HTTPS_ADAPTER)
+    return session
+
+
+@lru_cache(maxsize=4)
+def _load_service_account(path: str) -> service_account.Credentials:
+    # Parsing the keyfile imports an RSA key; do it once per path and let the
+    # credentials refresh their own token afterwards.
+    return service_account.Credentials.from_service_account_file(
+        path, scopes=OauthConstants.SCOPES
+    )
+
 
 class GoogleSheetClientManager(HelperMixin, LoggingMixin):
     _secret_path_cache = None
-    _spreadsheet_cache = TTLCache(maxsize=8, ttl=60)
+    _client_config_cache = None
+    # Keyed per user (see _spreadsheet_cache_key) so each request after the
+    # first skips the Drive lookup. Entries are (spreadsheet, loaded_at); past
+    # SPREADSHEET_FRESH_FOR they are still served while a background refresh
+    # runs, and the TTLCache drops them outright at twice that age. TTLCache is
+    # not thread-safe; hold the lock.
+    SPREADSHEET_FRESH_FOR = 600  # seconds
+    _spreadsheet_cache = TTLCache(maxsize=1024, ttl=2 * SPREADSHEET_FRESH_FOR)
+    _refreshing_spreadsheets = set()
     _worksheet_cache = TTLCache(maxsize=16, ttl=60)
+    _cache_lock = threading.RLock()
 
     # Retry configuration
     MAX_RETRIES = 3
     INITIAL_BACKOFF = 1  # seconds
     MAX_BACKOFF = 30  # seconds
+    # Rate-limit waits happen inside the web request; anything longer is
+    # handed back to the client as a 429 instead of holding the worker.
+    MAX_RATE_LIMIT_WAIT = 3  # seconds
+    # A 500/502 can arrive after the server applied the write, so calls that
+    # add rows or files are not retried on those (a retry would duplicate them).
+    # 503 means the request was not served and stays retryable for everything.
+    NON_IDEMPOTENT_OPERATIONS = frozenset(
+        {"append_row", "append_rows", "insert_row", "insert_rows", "create"}
+    )
 
     @classmethod
     def client_secret_path(cls) -> str:
-        inline_secret = os.environ.get("GOOGLE_OAUTH_CLIENT_SECRETS_DATA")
+        # get_flow runs on every OAuth step; once the path is settled for the
+        # current target and inline secret, skip the file IO entirely.
         target_path = os.environ.get(
             "GOOGLE_OAUTH_CLIENT_SECRETS",
             os.path.join(settings.BASE_DIR, "client_secret.json"),
         )
+        inline_secret = os.environ.get("GOOGLE_OAUTH_CLIENT_SECRETS_DATA")
+        digest = (
+            hashlib.sha256(inline_secret.encode("utf-8")).hexdigest()
+            if inline_secret
+            else None
+        )
+        cache_key = (target_path, digest)
+        if cls._secret_path_cache == cache_key:
+            return target_path
 
         if inline_secret:
-            if cls._secret_path_cache:
-                return cls._secret_path_cache
-
-            os.makedirs(os.path.dirname(target_path), exist_ok=True)
-            with open(target_path, "w", encoding="utf-8") as secret_file:
-                secret_file.write(inline_secret)
-            cls._secret_path_cache = target_path
+            if not cls._secret_file_matches(target_path, inline_secret):
+                cls._write_secret_file(target_path, inline_secret)
+            cls._secret_path_cache = cache_key
+        elif os.path.exists(target_path):
+            cls._secret_path_cache = cache_key
 
         return target_path
 
+    @classmethod
+    def inline_client_config(cls) -> dict | None:
+        """
+        Parsed GOOGLE_OAUTH_CLIENT_SECRETS_DATA, or None when it is unset.
+
+        Lets OAuth flows be built from memory instead of re-reading the
+        secret file; the parse is reused until the env value changes.
+        """
+        inline_secret = os.environ.get("GOOGLE_OAUTH_CLIENT_SECRETS_DATA")
+        if not inline_secret:
+            return None
+        cached = cls._client_config_cache
+        if cached is None or cached[0] != inline_secret:
+            cached = (inline_secret, json.loads(inline_secret))
+            cls._client_config_cache = cached
+        return cached[1]
+
+    @staticmethod
+    def _write_secret_file(path, contents):
+        # Write beside the target and rename so a concurrent worker never
+        # reads a half-written file; os.replace is atomic on POSIX.
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp.{os.getpid()}"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as secret_file:
+                secret_file.write(contents)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _secret_file_matches(path, contents) -> bool:
+        try:
+            with open(path, encoding="utf-8") as secret_file:
+                return secret_file.read() == contents
+        except OSError:
+            return False
+
     def __init__(
         self,
         sheet_name="AmiiboCollection",
@@ -72,18 +190,90 @@ class GoogleSheetClientManager(HelperMixin, LoggingMixin):
 
     @cached_property
     def spreadsheet(self):
+        return self.load_spreadsheet()
+
+    def load_spreadsheet(self):
+        """Return the user's spreadsheet, opening it only on a cache miss."""
         cache_key = self._spreadsheet_cache_key()
-        if cache_key in self._spreadsheet_cache:
-            return self._spreadsheet_cache[cache_key]
+        with self._cache_lock:
+            entry = self._spreadsheet_cache.get(cache_key)
+
+        if entry is None:
+            spreadsheet = self._refresh_spreadsheet(cache_key)
+        else:
+            spreadsheet, loaded_at = entry
+            if hasattr(spreadsheet, "id"):
+                self.spreadsheet_id = spreadsheet.id
+            if time.monotonic() - loaded_at > self.SPREADSHEET_FRESH_FOR:
+                self._schedule_spreadsheet_refresh(cache_key, self.spreadsheet_id)
+
+        self.__dict__["spreadsheet"] = spreadsheet
+        return spreadsheet
 
+    def _refresh_spreadsheet(self, cache_key):
         spreadsheet = self._open_or_create_spreadsheet()
         if hasattr(spreadsheet, "id"):
             self.spreadsheet_id = spreadsheet.id
-        cache_key = self._spreadsheet_cache_key()
         self._initialize_default_worksheets(spreadsheet)
-        self._spreadsheet_cache[cache_key] = spreadsheet
+        with self._cache_lock:
+            self._spreadsheet_cache[cache_key] = (spreadsheet, time.monotonic())
         return spreadsheet
 
+    def _schedule_spreadsheet_refresh(self, cache_key, spreadsheet_id):
+        """
+        Re-open a stale cache entry off the request path, once per key.
+
+        The job runs on its own manager built from a snapshot of this one's
+        credentials, so it never touches the request's object, and it only
+        re-opens the known spreadsheet: creating or provisioning sheets stays
+        on the request path.
+        """
+        if not spreadsheet_id:
+            return
+        with self._cache_lock:
+            if cache_key in self._refreshing_spreadsheets:
+                return
+            self._refreshing_spreadsheets.add(cache_key)
+
+        snapshot = {
+            "sheet_name": self.sheet_name,
+            "credentials_file": self.credentials_file,
+            "creds_json": dict(self.creds_json) if self.creds_json else None,
+            "spreadsheet_id": spreadsheet_id,
+        }
+
+        def refresh():
+            manager = type(self)(**snapshot)
+            try:
+                spreadsheet = manager._retry_with_backoff(
+                    manager.client.open_by_key, spreadsheet_id
+                )
+                with self._cache_lock:
+                    self._spreadsheet_cache[cache_key] = (
+                        spreadsheet,
+                        time.monotonic(),
+                    )
+            except Exception as error:  # the stale entry keeps serving
+                manager.log_warning(
+                    "Background refresh of spreadsheet '%s' failed: %s",
+                    spreadsheet_id,
+                    error,
+                )
+            finally:
+                with self._cache_lock:
+                    self._refreshing_spreadsheets.discard(cache_key)
+
+        _REFRESH_EXECUTOR.submit(refresh)
+
+    def invalidate_spreadsheet_cache(self):
+        """Forget the cached spreadsheet and its worksheets for this user."""
+        with self._cache_lock:
+            self._spreadsheet_cache.pop(self._spreadsheet_cache_key(), None)
+            for key in [
+                key for key in self._worksheet_cache if key[0] == self.spreadsheet_id
+            ]:
+                self._worksheet_cache.pop(key, None)
+
     def _retry_with_backoff(self, func, *args, **kwargs):
         """
         Retry a function with exponential backoff for transient errors.
@@ -110,37 +300,65 @@ class GoogleSheetClientManager(HelperMixin, LoggingMixin):
                     error.response.status_code if hasattr(error, "response") else None
                 )
 
-                # Handle different error codes
+                # Handle different error codes. Cached handles may point at a
+                # deleted or unshared spreadsheet, so those errors drop them;
+                # quota errors keep them so a throttled user is not re-provisioned.
                 if error_code == 403:
                     # Check for specific 403 error types
                     error_message = str(error).lower()
                     if "insufficient authentication scopes" in error_message:
                         raise InsufficientScopesError() from error
-                    elif "quota" in error_message or "limit" in error_message:
+                    elif self._is_quota_error(error):
                         raise QuotaExceededError() from error
+                    self.invalidate_spreadsheet_cache()
                     raise SpreadsheetPermissionError(self.spreadsheet_id) from error
 
                 elif error_code == 404:
+                    self.invalidate_spreadsheet_cache()
                     raise SpreadsheetNotFoundError(self.spreadsheet_id) from error
 
                 elif error_code == 429:
-                    # Rate limit - extract retry_after if available
-                    retry_after = 30
-                    if hasattr(error, "response") and error.response:
-                        retry_after = int(error.response.headers.get("Retry-After", 30))
-                    raise RateLimitError(retry_after=retry_after) from error
+                    # Absorb short rate-limit waits here; anything longer than
+                    # MAX_RATE_LIMIT_WAIT goes back to the caller as RateLimitError.
+                    retry_after = self._retry_after_header(error)
+                    if attempt < self.MAX_RETRIES - 1 and (
+                        retry_after is None or retry_after <= self.MAX_RATE_LIMIT_WAIT
+                    ):
+                        wait = (
+                            retry_after
+                            if retry_after is not None
+                            else min(
+                                self._backoff_delay(attempt), self.MAX_RATE_LIMIT_WAIT
+                            )
+                        )
+                        self.log_warning(
+                            "Google Sheets rate limited (429), retrying in %s seconds (attempt %d/%d)",
+                            wait,
+                            attempt + 1,
+                            self.MAX_RETRIES,
+                        )
+                        time.sleep(wait)
+                        continue
+                    raise RateLimitError(
+                        retry_after=retry_after if retry_after is not None else 30
+                    ) from error
 
                 elif error_code == 401:
+                    self.invalidate_spreadsheet_cache()
                     raise InvalidCredentialsError() from error
 
-                elif error_code == 503:
-                    # Service unavailable - retry with backoff
-                    if attempt < self.MAX_RETRIES - 1:
-                        backoff = min(
-                            self.INITIAL_BACKOFF * (2**attempt), self.MAX_BACKOFF
-                        )
+                elif error_code in (500, 502, 503):
+                    # Transient server error - retry with backoff
+                    retryable = (
+                        error_code == 503
+                        or getattr(func, "__name__", None)
+                        not in self.NON_IDEMPOTENT_OPERATIONS
+                    )
+                    if retryable and attempt < self.MAX_RETRIES - 1:
+                        backoff = self._backoff_delay(attempt)
                         self.log_warning(
-                            "Google Sheets service unavailable (503), retrying in %s seconds (attempt %d/%d)",
+                            "Google Sheets server error (%s), retrying in %.1f seconds (attempt %d/%d)",
+                            error_code,
                             backoff,
                             attempt + 1,
                             self.MAX_RETRIES,
@@ -155,6 +373,7 @@ class GoogleSheetClientManager(HelperMixin, LoggingMixin):
                     raise
 
             except RefreshError as error:
+                self.invalidate_spreadsheet_cache()
                 # Handle expired or revoked OAuth tokens
                 self.log_warning(
                     "OAuth token expired or revoked: %s. User needs to re-authenticate.",
@@ -169,9 +388,9 @@ class GoogleSheetClientManager(HelperMixin, LoggingMixin):
             except requests.exceptions.Timeout as error:
                 last_exception = error
                 if attempt < self.MAX_RETRIES - 1:
-                    backoff = min(self.INITIAL_BACKOFF * (2**attempt), self.MAX_BACKOFF)
+                    backoff = self._backoff_delay(attempt)
                     self.log_warning(
-                        "Request timeout, retrying in %s seconds (attempt %d/%d)",
+                        "Request timeout, retrying in %.1f seconds (attempt %d/%d)",
                         backoff,
                         attempt + 1,
                         self.MAX_RETRIES,
@@ -184,6 +403,44 @@ class GoogleSheetClientManager(HelperMixin, LoggingMixin):
         if last_exception:
             raise ServiceUnavailableError() from last_exception
 
+    _QUOTA_REASONS = frozenset(
+        {
+            "ratelimitexceeded",
+            "userratelimitexceeded",
+            "quotaexceeded",
+            "dailylimitexceeded",
+        }
+    )
+
+    @classmethod
+    def _is_quota_error(cls, error) -> bool:
+        details = getattr(error, "error", None) or {}
+        reasons = {
+            str(item.get("reason", "")).replace("_", "").lower()
+            for item in [*details.get("errors", []), *details.get("details", [])]
+            if isinstance(item, dict)
+        }
+        if reasons & cls._QUOTA_REASONS:
+            return True
+        error_message = str(error).lower()
+        return "quota" in error_message or "limit" in error_message
+
+    def _backoff_delay(self, attempt: int) -> float:
+        # Jitter keeps concurrent workers from retrying in lockstep.
+        base = min(self.INITIAL_BACKOFF * (2**attempt), self.MAX_BACKOFF)
+        return base + random.uniform(0, self.INITIAL_BACKOFF)
+
+    @staticmethod
+    def _retry_after_header(error) -> int | None:
+        # requests.Response is falsy for 4xx, so compare against None.
+        response = getattr(error, "response", None)
+        if response is None:
+            return None
+        try:
+            return int(response.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            return None
+
     def execute_worksheet_operation(self, operation_func, *args, **kwargs):
         """
         Execute a worksheet operation with retry and error handling.
@@ -223,19 +480,13 @@ class GoogleSheetClientManager(HelperMixin, LoggingMixin):
                     self.spreadsheet_id,
                 )
 
-        # Try to open by name - use retry logic to catch and handle API errors properly
+        # Try to open by name - use retry logic to catch and handle API errors
+        # properly. client.open is itself a name-filtered Drive listing, so a
+        # miss here means the spreadsheet has to be created.
         try:
             return self._retry_with_backoff(self.client.open, self.sheet_name)
         except gspread.exceptions.SpreadsheetNotFound:
             pass
-        except AttributeError:
-            # Clients used in tests may not support name-based open; fall back to
-            # drive.file discovery and creation.
-            pass
-
-        # Try to find existing spreadsheet
-        if existing_spreadsheet := self._find_existing_spreadsheet_by_name():
-            return existing_spreadsheet
 
         self.log_info(
             "Spreadsheet '%s' not found; attempting to create it with Drive file access.",
@@ -262,109 +513,233 @@ class GoogleSheetClientManager(HelperMixin, LoggingMixin):
             self.log_error("%s Error: %s", message, error)
             raise ValueError(message) from error
 
-    def _find_existing_spreadsheet_by_name(self):
-        try:
-            spreadsheets = self.client.list_spreadsheet_files()
-        except Exception as error:  # gspread can surface multiple exception types
-            self.log_warning(
-                "Unable to list accessible spreadsheets for '%s': %s",
-                self.sheet_name,
-                error,
-            )
-            return None
-
-        for spreadsheet in spreadsheets:
-            if spreadsheet.get("name") != self.sheet_name:
-                continue
-
-            try:
-                return self.client.open_by_key(spreadsheet.get("id"))
-            except gspread.exceptions.SpreadsheetNotFound:
-                self.log_warning(
-                    "Spreadsheet id '%s' for '%s' was not found during lookup.",
-                    spreadsheet.get("id"),
-                    self.sheet_name,
-                )
-                continue
+    def _initialize_default_worksheets(self, spreadsheet):
+        # One metadata fetch answers every existence check below.
+        by_title = self._worksheets_by_title(spreadsheet)
+        if hasattr(spreadsheet, "batch_update"):
+            self._provision_default_worksheets(spreadsheet, by_title)
+        self._get_or_create_worksheet(
+            spreadsheet, self.work_sheet_amiibo_manager, by_title
+        )
+        self._get_or_create_worksheet(
+            spreadsheet, self.work_sheet_config_manager, by_title
+        )
+        self._remove_default_sheet_if_present(spreadsheet, by_title)
 
-        return None
+    def _worksheets_by_title(self, spreadsheet):
+        if not hasattr(spreadsheet, "fetch_sheet_metadata"):
+            worksheets = self._retry_with_backoff(spreadsheet.worksheets)
+            return {worksheet.title: worksheet for worksheet in worksheets}
 
-    def _initialize_default_worksheets(self, spreadsheet):
-        self._get_or_create_worksheet(spreadsheet, self.work_sheet_amiibo_manager)
-        self._get_or_create_worksheet(spreadsheet, self.work_sheet_config_manager)
-        self._remove_default_sheet_if_present(spreadsheet)
+        # worksheets() pulls the full metadata (formats, protected ranges...);
+        # only the tab properties are needed to build Worksheet handles.
+        metadata = self._retry_with_backoff(
+            spreadsheet.fetch_sheet_metadata, params={"fields": "sheets.properties"}
+        )
+        return {
+            sheet["properties"]["title"]: gspread.Worksheet(
+                spreadsheet, sheet["properties"], spreadsheet.id, spreadsheet.client
+            )
+            for sheet in metadata.get("sheets", [])
+        }
 
     def get_creds(self, creds_json) -> Credentials:
         creds = Credentials.from_authorized_user_info(creds_json, OauthConstants.SCOPES)
         return creds
 
     @staticmethod
-    def get_flow() -> Flow:
-        flow = Flow.from_client_secrets_file(
+    def get_flow(**flow_kwargs) -> Flow:
+        """
+        Build the OAuth flow, defaulting to the configured redirect URI.
+
+        An inline client secret is already in memory; only fall back to the
+        secrets file when the app is configured with a path.
+        """
+        if "redirect_uri" not in flow_kwargs:
+            flow_kwargs["redirect_uri"] = OauthConstants.configured_redirect_uri()
+        client_config = GoogleSheetClientManager.inline_client_config()
+        if client_config is not None:
+            return Flow.from_client_config(
+                client_config, scopes=OauthConstants.SCOPES, **flow_kwargs
+            )
+        return Flow.from_client_secrets_file(
             GoogleSheetClientManager.client_secret_path(),
             scopes=OauthConstants.SCOPES,
-            redirect_uri=OauthConstants.configured_redirect_uri(),
+            **flow_kwargs,
         )
-        return flow
 
     @cached_property
     def client(self):
         if oauth_creds := self.get_creds(self.creds_json):
-            return gspread.authorize(oauth_creds)
-        creds = ServiceAccountCredentials.from_json_keyfile_name(
-            self.credentials_file, OauthConstants.SCOPES
-        )
-        client = gspread.authorize(creds)
-        return client
+            return gspread.authorize(
+                oauth_creds, session=_authorized_session(oauth_creds)
+            )
+        creds = _load_service_account(self.credentials_file)
+        return gspread.authorize(creds, session=_authorized_session(creds))
 
-    def _get_or_create_worksheet(self, spreadsheet, worksheet_name):
+    def _get_or_create_worksheet(self, spreadsheet, worksheet_name, by_title=None):
         cache_key = self._worksheet_cache_key(spreadsheet.id, worksheet_name)
-        if cache_key in self._worksheet_cache:
-            return self._worksheet_cache[cache_key]
+        with self._cache_lock:
+            cached = self._worksheet_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if by_title is None:
+            # One metadata fetch resolves every tab; cache them all so the
+            # sibling worksheet lookup in this request is a cache hit too.
+            by_title = self._worksheets_by_title(spreadsheet)
+            with self._cache_lock:
+                for title, worksheet in by_title.items():
+                    self._worksheet_cache[
+                        self._worksheet_cache_key(spreadsheet.id, title)
+                    ] = worksheet
+        sheet = by_title.get(worksheet_name)
+
+        if sheet is None:
+            sheet = self._create_worksheet_with_header(
+                spreadsheet,
+                worksheet_name,
+                self._header_rows(worksheet_name),
+                taken_ids={getattr(ws, "id", None) for ws in by_title.values()},
+            )
+            by_title[worksheet_name] = sheet
 
-        try:
-            sheet = self._retry_with_backoff(spreadsheet.worksheet, worksheet_name)
-            created = False
-        except gspread.exceptions.WorksheetNotFound:
+        with self._cache_lock:
+            self._worksheet_cache[cache_key] = sheet
+        return sheet
+
+    def _header_rows(self, worksheet_name):
+        if worksheet_name == self.work_sheet_amiibo_manager:
+            return [list(_AMIIBO_HEADER)]
+        if worksheet_name == self.work_sheet_config_manager:
+            return [list(row) for row in _CONFIG_ROWS]
+        return []
+
+    def _create_worksheet_with_header(
+        self, spreadsheet, title, header_rows, taken_ids=frozenset()
+    ):
+        """
+        Add a worksheet and write its header rows in a single batchUpdate.
+
+        The sheetId is chosen client-side so the updateCells request can target
+        the new sheet in the same call. Spreadsheets without batch_update (test
+        doubles) fall back to add_worksheet followed by one update.
+        """
+        if not hasattr(spreadsheet, "batch_update"):
             sheet = self._retry_with_backoff(
-                spreadsheet.add_worksheet, title=worksheet_name, rows=500, cols=7
+                spreadsheet.add_worksheet, title=title, rows=500, cols=7
             )
-            created = True
-
-        if created:
-            if worksheet_name == self.work_sheet_amiibo_manager:
+            if header_rows:
+                end_cell = gspread.utils.rowcol_to_a1(
+                    len(header_rows), max(len(row) for row in header_rows)
+                )
                 self._retry_with_backoff(
-                    sheet.append_row,
-                    [
-                        "Amiibo ID",
-                        "Amiibo Name",
-                        "Game Series",
-                        "Release Date",
-                        "Type",
-                        "Collected Status",
-                        "Favorite",
-                    ],
+                    sheet.update,
+                    values=header_rows,
+                    range_name=f"A1:{end_cell}",
+                    value_input_option="RAW",
                 )
+            return sheet
 
-            if worksheet_name == self.work_sheet_config_manager:
-                self._retry_with_backoff(
-                    sheet.append_row, ["Config name", "Config value"]
+        sheet_id = self._new_sheet_id(taken_ids)
+        data = self._retry_with_backoff(
+            spreadsheet.batch_update,
+            {"requests": self._add_sheet_requests(sheet_id, title, header_rows)},
+        )
+        properties = data["replies"][0]["addSheet"]["properties"]
+        return gspread.Worksheet(
+            spreadsheet, properties, spreadsheet.id, spreadsheet.client
+        )
+
+    def _provision_default_worksheets(self, spreadsheet, by_title):
+        """
+        Add the missing managed worksheets, seed their headers and drop the
+        default "Sheet1" tab in one batchUpdate, updating by_title to match.
+        """
+        managed_titles = (
+            self.work_sheet_amiibo_manager,
+            self.work_sheet_config_manager,
+        )
+        taken_ids = {worksheet.id for worksheet in by_title.values()}
+        requests_body = []
+        for title in managed_titles:
+            if title in by_title:
+                continue
+            sheet_id = self._new_sheet_id(taken_ids)
+            taken_ids.add(sheet_id)
+            requests_body.extend(
+                self._add_sheet_requests(sheet_id, title, self._header_rows(title))
+            )
+
+        # The delete goes after the adds so the spreadsheet never has zero sheets.
+        default_sheet = by_title.get("Sheet1")
+        if default_sheet is not None and default_sheet.title not in managed_titles:
+            requests_body.append({"deleteSheet": {"sheetId": default_sheet.id}})
+        else:
+            default_sheet = None
+
+        if not requests_body:
+            return
+
+        data = self._retry_with_backoff(
+            spreadsheet.batch_update, {"requests": requests_body}
+        )
+        for reply in data["replies"]:
+            if "addSheet" in reply:
+                properties = reply["addSheet"]["properties"]
+                by_title[properties["title"]] = gspread.Worksheet(
+                    spreadsheet, properties, spreadsheet.id, spreadsheet.client
                 )
-                self._retry_with_backoff(sheet.append_row, ["DarkMode", "0"])
-                self._retry_with_backoff(sheet.append_row, ["IgnoreType:Band", "1"])
-                self._retry_with_backoff(sheet.append_row, ["IgnoreType:Card", "1"])
-                self._retry_with_backoff(sheet.append_row, ["IgnoreType:Yarn", "1"])
+        if default_sheet is not None:
+            del by_title["Sheet1"]
 
-        self._worksheet_cache[cache_key] = sheet
-        return sheet
+    @staticmethod
+    def _new_sheet_id(taken_ids):
+        sheet_id = random.randrange(1, 2**31 - 1)
+        while sheet_id in taken_ids:
+            sheet_id = random.randrange(1, 2**31 - 1)
+        return sheet_id
+
+    @staticmethod
+    def _add_sheet_requests(sheet_id, title, header_rows):
+        requests_body = [
+            {
+                "addSheet": {
+                    "properties": {
+                        "sheetId": sheet_id,
+                        "title": title,
+                        "sheetType": "GRID",
+                        "gridProperties": {"rowCount": 500, "columnCount": 7},
+                    }
+                }
+            }
+        ]
+        if header_rows:
+            requests_body.append(
+                {
+                    "updateCells": {
+                        "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0},
+                        "rows": [
+                            {
+                                "values": [
+                                    {"userEnteredValue": {"stringValue": value}}
+                                    for value in row
+                                ]
+                            }
+                            for row in header_rows
+                        ],
+                        "fields": "userEnteredValue",
+                    }
+                }
+            )
+        return requests_body
 
     def get_or_create_worksheet_by_name(self, worksheet_name):
         return self._get_or_create_worksheet(self.spreadsheet, worksheet_name)
 
-    def _remove_default_sheet_if_present(self, spreadsheet):
-        try:
-            default_sheet = self._retry_with_backoff(spreadsheet.worksheet, "Sheet1")
-        except gspread.exceptions.WorksheetNotFound:
+    def _remove_default_sheet_if_present(self, spreadsheet, by_title):
+        default_sheet = by_title.get("Sheet1")
+        if default_sheet is None:
             return
 
         managed_titles = {
@@ -378,13 +753,22 @@ class GoogleSheetClientManager(HelperMixin, LoggingMixin):
         if hasattr(spreadsheet, "del_worksheet"):
             self._retry_with_backoff(spreadsheet.del_worksheet, default_sheet)
 
-    def _spreadsheet_cache_key(self) -> tuple[str, str, bool, str | None]:
-        return (
-            self.sheet_name,
-            self.credentials_file,
-            bool(self.creds_json),
-            self.spreadsheet_id,
-        )
+    def _spreadsheet_cache_key(self) -> tuple[str, str]:
+        return self._user_cache_key
+
+    @cached_property
+    def _user_cache_key(self) -> tuple[str, str]:
+        # The refresh token is stable per user grant, unlike the access token;
+        # hash it so no credential material sits in the cache keys. Computed
+        # once per manager since the credentials never change after __init__.
+        if self.creds_json:
+            secret = self.creds_json.get("refresh_token") or self.creds_json.get(
+                "token", ""
+            )
+            identity = hashlib.sha256(secret.encode("utf-8")).hexdigest()
+        else:
+            identity = self.credentials_file
+        return (identity, self.sheet_name)
 
     @staticmethod
     def _worksheet_cache_key(
@@ -1,11 +1,14 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import inspect
 import json
 import logging
+import time
 import uuid
-from functools import partialmethod
+from functools import cached_property
 from importlib import import_module
 from pathlib import Path
 
@@ -72,23 +75,44 @@ def check_rate_limit(
     return None
 
 
+_LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "exception": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
 class LoggingMixin(object):
     """
     Common tools for class OOP logging
     """
 
-    @property
-    def logger(self):
-        if not getattr(self, "proc_ref", None):
-            self.proc_ref = uuid.uuid1().hex
+    _logger = logging.getLogger("LoggingMixin")
 
-        if not hasattr(self, "__logger"):
-            self.__logger = logging.getLogger(self.__class__.__name__)
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolve the class logger once; getLogger takes the logging lock.
+        cls._logger = logging.getLogger(cls.__name__)
 
-        return self.__logger
+    @cached_property
+    def proc_ref(self):
+        return uuid.uuid4().hex
+
+    @property
+    def logger(self):
+        return self._logger
 
     def log(self, msg, *args, **extra):
         level = extra.pop("level", "info")
+        return self._emit(level, msg, args, extra)
+
+    def _emit(self, level, msg, args, extra):
+        # Skip building the JSON context when the level is filtered out.
+        if not self.logger.isEnabledFor(_LOG_LEVELS[level]):
+            return None
         log_fn = getattr(self.logger, level)
 
         log_extra = {**extra, "proc_ref": self.proc_ref}
@@ -100,11 +124,13 @@ class LoggingMixin(object):
         else:
             log_args = args
 
+        context = {}
         for key, value in log_extra.items():
-            if isinstance(value, uuid.UUID):
-                log_extra[key] = str(value)
-
-        context = {k: v for k, v in log_extra.items() if v is not None}
+            if value is None:
+                continue
+            if type(value) is uuid.UUID:
+                value = log_extra[key] = str(value)
+            context[key] = value
         if context:
             msg = f"{msg} | context={json.dumps(context, default=str, sort_keys=True)}"
 
@@ -146,22 +172,79 @@ class LoggingMixin(object):
     # An alternative to log_info that can be used for temporary logs.
     # Allows us to easily differentiate between logs that should be cleaned
     # up after a short time and logs that should remain in the codebase.
-    log_info_temp = partialmethod(log, level="info")
-    log_info = partialmethod(log, level="info")
-    log_warning = partialmethod(log, level="warning")
-    log_error = partialmethod(log, level="exception")
+    def log_info_temp(self, msg, *args, **extra):
+        return self._emit("info", msg, args, extra)
+
+    def log_info(self, msg, *args, **extra):
+        return self._emit("info", msg, args, extra)
+
+    def log_warning(self, msg, *args, **extra):
+        return self._emit("warning", msg, args, extra)
+
+    def log_error(self, msg, *args, **extra):
+        return self._emit("exception", msg, args, extra)
+
+
+# Shared across requests so amiiboapi.org connections stay alive; transient
+# 429/5xx responses get a short retry before we fall back to cached data.
+# This runs inside web requests, so an upstream Retry-After is ignored rather
+# than letting it park the worker for however long it asks, and timeouts are
+# not retried so a hanging API costs one timeout, not three.
+_AMIIBO_API_SESSION = requests.Session()
+_AMIIBO_API_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=2,
+            connect=0,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=False,
+        ),
+    ),
+)
 
 
 class AmiiboRemoteFetchMixin:
+    # The API returns the whole catalogue on every call and it rarely changes.
+    # Serve the cached list for an hour, then revalidate with the ETag so an
+    # unchanged catalogue costs a bodiless 304. The entry outlives the
+    # freshness window so the ETag (and a fallback copy) survive.
+    _REMOTE_AMIIBO_CACHE_KEY = "remote_amiibo_api"
+    _REMOTE_AMIIBO_FRESH_FOR = 3600
+    _REMOTE_AMIIBO_CACHE_TIMEOUT = 86400
+    # After a failed fetch, wait this long before trying the API again so an
+    # outage costs one timeout every few minutes rather than one per request.
+    _REMOTE_AMIIBO_RETRY_AFTER = 300
+
     def _fetch_remote_amiibos(self) -> list[dict]:
+        from django.core.cache import cache
+
         api_url = "https://amiiboapi.org/api/amiibo/"
+        cached = cache.get(self._REMOTE_AMIIBO_CACHE_KEY)
+        if (
+            cached
+            and time.time() - cached["fetched_at"] < self._REMOTE_AMIIBO_FRESH_FOR
+        ):
+            return cached["amiibos"]
+
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
 
         try:
-            response = requests.get(api_url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            amiibos = data.get("amiibo", [])
-            return amiibos if isinstance(amiibos, list) else []
+            response = _AMIIBO_API_SESSION.get(api_url, timeout=10, headers=headers)
+            if response.status_code == 304 and cached:
+                amiibos, etag = cached["amiibos"], cached["etag"]
+            else:
+                response.raise_for_status()
+                data = response.json()
+                amiibos = data.get("amiibo", [])
+                amiibos = amiibos if isinstance(amiibos, list) else []
+                etag = response.headers.get("ETag")
         except (requests.RequestException, ValueError) as error:
             if hasattr(self, "log_warning"):
                 self.log_warning(
@@ -169,7 +252,25 @@ class AmiiboRemoteFetchMixin:
                     error=str(error),
                     api_url=api_url,
                 )
-            return []
+            amiibos = cached["amiibos"] if cached else []
+            retry_at = time.time() + self._REMOTE_AMIIBO_RETRY_AFTER
+            cache.set(
+                self._REMOTE_AMIIBO_CACHE_KEY,
+                {
+                    "amiibos": amiibos,
+                    "etag": cached.get("etag") if cached else None,
+                    "fetched_at": retry_at - self._REMOTE_AMIIBO_FRESH_FOR,
+                },
+                self._REMOTE_AMIIBO_CACHE_TIMEOUT,
+            )
+            return amiibos
+
+        cache.set(
+            self._REMOTE_AMIIBO_CACHE_KEY,
+            {"amiibos": amiibos, "etag": etag, "fetched_at": time.time()},
+            self._REMOTE_AMIIBO_CACHE_TIMEOUT,
+        )
+        return amiibos
 
 
 class AmiiboLocalFetchMixin:
@@ -189,16 +290,7 @@ class AmiiboLocalFetchMixin:
 
         database_path = Path(__file__).parent / "data" / "amiibo_database.json"
         try:
-            with database_path.open(encoding="utf-8") as database_file:
-                data = json.load(database_file)
-                amiibos = data.get("amiibo", [])
-                result = amiibos if isinstance(amiibos, list) else []
-                cache.set(
-                    self._LOCAL_AMIIBO_CACHE_KEY,
-                    result,
-                    self._LOCAL_AMIIBO_CACHE_TIMEOUT,
-                )
-                return result
+            data = json.loads(database_path.read_bytes())
         except (FileNotFoundError, json.JSONDecodeError) as error:
             if hasattr(self, "log_error"):
                 self.log_error(
@@ -207,3 +299,12 @@ class AmiiboLocalFetchMixin:
                     path=str(database_path),
                 )
             return []
+
+        amiibos = data.get("amiibo", [])
+        result = amiibos if isinstance(amiibos, list) else []
+        cache.set(
+            self._LOCAL_AMIIBO_CACHE_KEY,
+            result,
+            self._LOCAL_AMIIBO_CACHE_TIMEOUT,
+        )
+        return result
@@ -1,6 +1,8 @@
 from pathlib import Path
 from django.core.management.base import BaseCommand
-from tracker.scrapers import NintendoAmiiboScraper
+from tracker.scrapers import NintendoDotComScraper
+
+MAX_SHOWN_CHANGES = 20
 
 
 class Command(BaseCommand):
@@ -25,8 +27,8 @@ class Command(BaseCommand):
 
         self.stdout.write("Fetching Nintendo amiibo lineup...")
 
-        # Use the NintendoAmiiboScraper class
-        scraper = NintendoAmiiboScraper(min_similarity=min_similarity)
+        # Use the NintendoDotComScraper class
+        scraper = NintendoDotComScraper(min_similarity=min_similarity)
 
         if dry_run:
             # For dry run, manually run the scraping logic without saving
@@ -50,7 +52,9 @@ class Command(BaseCommand):
             matched_count = 0
             new_count = 0
             updated_count = 0
-            updates = []
+            # Only the first MAX_SHOWN_CHANGES lines are printed; the rest are
+            # counted via new_count/updated_count instead of being formatted.
+            shown_changes = []
 
             for scraped in scraped_amiibos:
                 match = scraper.find_best_match(scraped, existing_amiibos)
@@ -60,12 +64,16 @@ class Command(BaseCommand):
                     updated = scraper.update_amiibo(match, scraped)
                     if updated:
                         updated_count += 1
-                        updates.append(f"  ~ Updated: {match['name']} with new data")
+                        if len(shown_changes) < MAX_SHOWN_CHANGES:
+                            shown_changes.append(
+                                f"  ~ Updated: {match['name']} with new data"
+                            )
                 else:
                     new_count += 1
                     new_amiibo = scraper.create_placeholder_amiibo(scraped)
                     existing_amiibos.append(new_amiibo)
-                    updates.append(f"  + New placeholder: {scraped['name']}")
+                    if len(shown_changes) < MAX_SHOWN_CHANGES:
+                        shown_changes.append(f"  + New placeholder: {scraped['name']}")
 
             # Display results
             self.stdout.write("\n" + "=" * 60)
@@ -74,12 +82,13 @@ class Command(BaseCommand):
             self.stdout.write(f"Updated: {updated_count}")
             self.stdout.write("=" * 60 + "\n")
 
-            if updates:
+            if shown_changes:
                 self.stdout.write("Changes:")
-                for update in updates[:20]:  # Show first 20 changes
-                    self.stdout.write(update)
-                if len(updates) > 20:
-                    self.stdout.write(f"  ... and {len(updates) - 20} more")
+                for change in shown_changes:
+                    self.stdout.write(change)
+                hidden = updated_count + new_count - len(shown_changes)
+                if hidden:
+                    self.stdout.write(f"  ... and {hidden} more")
 
             self.stdout.write(
                 self.style.WARNING("\nDry run complete - no changes saved")
@@ -1,16 +1,53 @@
 import hashlib
 import json
 import re
-from datetime import datetime
+from datetime import date, datetime
 from difflib import SequenceMatcher
 from pathlib import Path
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from tracker.firestore_client import AMIIBO_COMMENTS_COLLECTION, rekey_comments
 from tracker.helpers import LoggingMixin
 
+# One pooled session for every scrape so the series pages on amiibo.life
+# reuse a kept-alive connection instead of a fresh TLS handshake each.
+_SCRAPER_SESSION = requests.Session()
+_SCRAPER_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)
+        ),
+    ),
+)
+
+# The lineup page is large but only the detail links matter; parsing just
+# those (and their children) skips building the rest of the tree.
+NINTENDO_DETAIL_HREF = re.compile(r"/us/amiibo/detail/")
+NINTENDO_DETAIL_LINKS = SoupStrainer("a", href=NINTENDO_DETAIL_HREF)
+
+# normalize_name patterns, shared by both scrapers.
+_COMPANION_PARENS = re.compile(r"\s*\(\s*&\s*(.*?)\)")
+_VARIANT_PARENS = re.compile(r"\s*\(.*?\)\s*")
+_SIDE_ORDER_SUFFIX = re.compile(r"\s*-\s*side order\s*$", re.IGNORECASE)
+_ALTERNA_SUFFIX = re.compile(r"\s*-\s*alterna\s*$", re.IGNORECASE)
+_NON_WORD = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+_SERIES_SUFFIX = re.compile(r"\s+series$", re.IGNORECASE)
+_CARD_SERIES_NUMBER = re.compile(r"series\s+\d+$")
+_AMIIBO_TYPE_LABEL = re.compile(r"\s*amiibo (figures?|cards?)\s*$", re.IGNORECASE)
+_IMAGE_TRANSFORMS = re.compile(r"/image/upload/.+?/amiibo/")
+_DATE_ANY = re.compile(r"\d{1,2}/\d{1,2}/\d{2,4}|Available\s+\d|20\d{2}")
+_MDY_DATE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{2,4})")
+_YEAR = re.compile(r"(20\d{2})")
+
 
 def migrate_comments_on_id_change(scraper, old_id, new_id):
     """
@@ -55,6 +92,10 @@ class AmiiboLifeScraper(LoggingMixin):
         # scrape_amiibo_life(). Lets scrape_series_pages() skip figures already
         # captured there and only add announced-but-undated (TBA) ones.
         self.seen_release_hrefs = set()
+        # normalize_name results keyed by raw name; find_best_match sees every
+        # existing name once per scraped entry.
+        self._normalized_names = {}
+        self._word_sets = {}
 
     def should_run(self):
         """
@@ -106,9 +147,10 @@ class AmiiboLifeScraper(LoggingMixin):
             matched_count = 0
             new_count = 0
             updated_amiibos = []
+            name_index = self.index_by_name(existing_amiibos)
 
             for scraped in scraped_amiibos:
-                match = self.find_best_match(scraped, existing_amiibos)
+                match = self.find_best_match(scraped, existing_amiibos, name_index)
 
                 if match:
                     matched_count += 1
@@ -118,6 +160,9 @@ class AmiiboLifeScraper(LoggingMixin):
                     new_count += 1
                     new_amiibo = self.create_placeholder_amiibo(scraped)
                     existing_amiibos.append(new_amiibo)
+                    name_index.setdefault(
+                        self._normalized_name(new_amiibo["name"]), []
+                    ).append(new_amiibo)
 
             # Backfill placeholders with AmiiboAPI data
             backfilled_count = 0
@@ -152,10 +197,10 @@ class AmiiboLifeScraper(LoggingMixin):
         """Scrape amiibos from amiibo.life releases page"""
         # Construct URL with current year
         url = f"{self.RELEASES_URL}#release-year-{self.current_year}"
-        self.log_info(f"Scraping from: {url}")
+        self.log_info("Scraping from: %s", url)
 
         try:
-            response = requests.get(self.RELEASES_URL, timeout=30)
+            response = _SCRAPER_SESSION.get(self.RELEASES_URL, timeout=30)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, "html.parser")
 
@@ -248,7 +293,7 @@ class AmiiboLifeScraper(LoggingMixin):
 
                     # Skip sets and bundles
                     if self.is_set_or_bundle(name):
-                        self.log_info(f"Skipping set/bundle: {name}")
+                        self.log_info("Skipping set/bundle: %s", name)
                         continue
 
                     amiibos.append(
@@ -265,7 +310,7 @@ class AmiiboLifeScraper(LoggingMixin):
                     self.log_warning("Error parsing amiibo card", error=str(e))
                     continue
 
-            self.log_info(f"Scraped {len(amiibos)} amiibos from amiibo.life")
+            self.log_info("Scraped %s amiibos from amiibo.life", len(amiibos))
             return amiibos
 
         except requests.RequestException as e:
@@ -284,7 +329,7 @@ class AmiiboLifeScraper(LoggingMixin):
         Returns a dict mapping each figure series slug to its display name.
         """
         try:
-            response = requests.get(self.RELEASES_URL, timeout=30)
+            response = _SCRAPER_SESSION.get(self.RELEASES_URL, timeout=30)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, "html.parser")
         except requests.RequestException as e:
@@ -314,9 +359,7 @@ class AmiiboLifeScraper(LoggingMixin):
 
             # Strip the type label and " series" suffix to get a clean name.
             text = max(texts, key=len)
-            name = re.sub(
-                r"\s*amiibo (figures?|cards?)\s*$", "", text, flags=re.IGNORECASE
-            )
+            name = _AMIIBO_TYPE_LABEL.sub("", text)
             name = self.clean_series(name)
             if not name or self.is_set_or_bundle(name):
                 continue
@@ -342,7 +385,7 @@ class AmiiboLifeScraper(LoggingMixin):
         for slug, series_name in self.discover_series().items():
             url = f"https://amiibo.life/amiibo/{slug}"
             try:
-                response = requests.get(url, timeout=30)
+                response = _SCRAPER_SESSION.get(url, timeout=30)
                 response.raise_for_status()
                 soup = BeautifulSoup(response.content, "html.parser")
             except requests.RequestException as e:
@@ -373,7 +416,7 @@ class AmiiboLifeScraper(LoggingMixin):
 
                 # Skip sets and bundles, same as the releases timeline
                 if self.is_set_or_bundle(name):
-                    self.log_info(f"Skipping set/bundle: {name}")
+                    self.log_info("Skipping set/bundle: %s", name)
                     continue
 
                 img_tag = card.find("img")
@@ -394,7 +437,7 @@ class AmiiboLifeScraper(LoggingMixin):
 
             if count:
                 self.log_info(
-                    f"Found {count} new TBA figure(s) on series page: {slug}"
+                    "Found %s new TBA figure(s) on series page: %s", count, slug
                 )
 
         return amiibos
@@ -424,7 +467,7 @@ class AmiiboLifeScraper(LoggingMixin):
 
     def clean_series(self, series_text):
         """Clean series name by removing ' series' suffix"""
-        return re.sub(r"\s+series$", "", series_text, flags=re.IGNORECASE)
+        return _SERIES_SUFFIX.sub("", series_text)
 
     def is_set_or_bundle(self, name):
         """
@@ -466,7 +509,7 @@ class AmiiboLifeScraper(LoggingMixin):
                 return True
 
         # Check for patterns like "Series N" at the end (card series)
-        if re.search(r"series\s+\d+$", name_lower):
+        if _CARD_SERIES_NUMBER.search(name_lower):
             return True
 
         return False
@@ -474,20 +517,29 @@ class AmiiboLifeScraper(LoggingMixin):
     def load_existing_amiibos(self):
         """Load existing amiibos from JSON file"""
         try:
-            with self.database_path.open(encoding="utf-8") as f:
-                data = json.load(f)
-                return data.get("amiibo", [])
+            data = json.loads(self.database_path.read_bytes())
+            return data.get("amiibo", [])
         except (FileNotFoundError, json.JSONDecodeError) as e:
             self.log_warning("Could not load database", error=str(e))
             return []
 
-    def find_best_match(self, scraped_amiibo, existing_amiibos):
+    def index_by_name(self, amiibos):
+        """Group amiibos by normalized name for exact lookups before fuzzing."""
+        index = {}
+        for amiibo in amiibos:
+            name = self._normalized_name(amiibo.get("name", ""))
+            index.setdefault(name, []).append(amiibo)
+        return index
+
+    def find_best_match(self, scraped_amiibo, existing_amiibos, name_index=None):
         """
         Find best matching amiibo using fuzzy name matching and date comparison.
 
         Args:
             scraped_amiibo: Dict with 'name', 'release_dates', etc.
             existing_amiibos: List of existing amiibo dicts
+            name_index: Optional index_by_name() of existing_amiibos; an
+                exact, series-compatible name hit skips the fuzzy scan
 
         Returns:
             Best matching amiibo or None
@@ -497,14 +549,16 @@ class AmiiboLifeScraper(LoggingMixin):
         scraped_series = scraped_amiibo.get("series", "")
 
         scraped_clean = self.normalize_name(scraped_name)
+        if name_index is not None:
+            for amiibo in name_index.get(scraped_clean, ()):
+                if self.series_compatible(scraped_series, amiibo.get("amiiboSeries")):
+                    return amiibo
+
         best_match = None
         best_score = 0
 
         for amiibo in existing_amiibos:
-            existing_clean = self.normalize_name(amiibo.get("name", ""))
-
-            # Calculate name similarity
-            name_score = self.calculate_similarity(scraped_clean, existing_clean)
+            existing_clean = self._normalized_name(amiibo.get("name", ""))
 
             # Penalize matches across clearly different series. Without this, a
             # new figure named after an existing character (e.g. "King Dedede &
@@ -534,6 +588,20 @@ class AmiiboLifeScraper(LoggingMixin):
                             # Close dates give smaller boost (within 30 days)
                             date_boost = max(date_boost, 0.15)
 
+            # Skip the full SequenceMatcher pass when even the optimistic
+            # score cannot beat the current best or reach the threshold.
+            ceiling = min(
+                1.0,
+                self.similarity_upper_bound(scraped_clean, existing_clean)
+                + date_boost
+                - series_penalty,
+            )
+            if ceiling <= best_score or ceiling < self.min_similarity:
+                continue
+
+            # Calculate name similarity
+            name_score = self.calculate_similarity(scraped_clean, existing_clean)
+
             # Combined score
             final_score = min(1.0, name_score + date_boost - series_penalty)
 
@@ -543,8 +611,10 @@ class AmiiboLifeScraper(LoggingMixin):
 
         if not best_match:
             self.log_warning(
-                f"✗ No match for: '{scraped_name}' "
-                f"(best score: {best_score:.2f}, threshold: {self.min_similarity})"
+                "✗ No match for: '%s' (best score: %.2f, threshold: %s)",
+                scraped_name,
+                best_score,
+                self.min_similarity,
             )
 
         return best_match
@@ -565,7 +635,7 @@ class AmiiboLifeScraper(LoggingMixin):
         """
 
         def significant_words(series):
-            words = self.normalize_name(self.clean_series(series or "")).split()
+            words = self._normalized_name(self.clean_series(series or "")).split()
             return {w for w in words if w not in self.SERIES_STOPWORDS}
 
         a = significant_words(series_a)
@@ -588,25 +658,35 @@ class AmiiboLifeScraper(LoggingMixin):
         # not a variant tag: "Kirby (& Warp Star)" must converge with the series
         # page form "Kirby & Warp Star". Unwrap "(& Companion)" before the
         # generic variant strip below so both forms normalize identically.
-        name = re.sub(r"\s*\(\s*&\s*(.*?)\)", r" \1", name)
+        name = _COMPANION_PARENS.sub(r" \1", name)
 
         # Remove common variant indicators in parentheses
-        name = re.sub(
-            r"\s*\(.*?\)\s*", " ", name
-        )  # Remove (Side Order), (Alterna), etc.
+        name = _VARIANT_PARENS.sub(" ", name)  # Remove (Side Order), (Alterna), etc.
 
         # Remove common variant suffixes with dashes
-        name = re.sub(r"\s*-\s*side order\s*$", "", name, flags=re.IGNORECASE)
-        name = re.sub(r"\s*-\s*alterna\s*$", "", name, flags=re.IGNORECASE)
+        name = _SIDE_ORDER_SUFFIX.sub("", name)
+        name = _ALTERNA_SUFFIX.sub("", name)
 
         # Remove special characters but keep spaces
-        name = re.sub(r"[^\w\s]", "", name)
+        name = _NON_WORD.sub("", name)
 
         # Normalize whitespace
-        name = re.sub(r"\s+", " ", name).strip()
+        name = _WHITESPACE.sub(" ", name).strip()
 
         return name
 
+    def _normalized_name(self, name):
+        cached = self._normalized_names.get(name)
+        if cached is None:
+            cached = self._normalized_names[name] = self.normalize_name(name)
+        return cached
+
+    def _word_set(self, name):
+        cached = self._word_sets.get(name)
+        if cached is None:
+            cached = self._word_sets[name] = frozenset(name.split())
+        return cached
+
     def calculate_similarity(self, name1, name2):
         """
         Calculate fuzzy similarity between two names using multiple methods.
@@ -619,15 +699,29 @@ class AmiiboLifeScraper(LoggingMixin):
 
         # Method 1: SequenceMatcher for character-level fuzzy matching
         sequence_score = SequenceMatcher(None, name1, name2).ratio()
+        return self._blend_similarity(sequence_score, name1, name2)
+
+    def similarity_upper_bound(self, name1, name2):
+        """
+        Cheap ceiling on calculate_similarity.
+
+        quick_ratio() is never below ratio(), and the rest of the blend is
+        computed exactly, so a candidate whose bound cannot win can be skipped.
+        """
+        if not name1 or not name2:
+            return 0
 
+        sequence_bound = SequenceMatcher(None, name1, name2).quick_ratio()
+        return self._blend_similarity(sequence_bound, name1, name2)
+
+    def _blend_similarity(self, sequence_score, name1, name2):
         # Method 2: Word-based matching (Jaccard similarity)
-        words1 = set(name1.split())
-        words2 = set(name2.split())
+        words1 = self._word_set(name1)
+        words2 = self._word_set(name2)
 
         if words1 and words2:
-            intersection = words1.intersection(words2)
-            union = words1.union(words2)
-            word_score = len(intersection) / len(union)
+            shared = len(words1 & words2)
+            word_score = shared / (len(words1) + len(words2) - shared)
         else:
             word_score = 0
 
@@ -655,8 +749,8 @@ class AmiiboLifeScraper(LoggingMixin):
             True if dates are within threshold, False otherwise
         """
         try:
-            d1 = datetime.strptime(date1, "%Y-%m-%d")
-            d2 = datetime.strptime(date2, "%Y-%m-%d")
+            d1 = date.fromisoformat(date1)
+            d2 = date.fromisoformat(date2)
             days_apart = abs((d1 - d2).days)
             return days_apart <= days_threshold
         except (ValueError, TypeError):
@@ -723,8 +817,10 @@ class AmiiboLifeScraper(LoggingMixin):
         """Save amiibos back to JSON file"""
         data = {"amiibo": amiibos}
 
-        with self.database_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Encode up front and write once; json.dump issues a write per token.
+        self.database_path.write_text(
+            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
 
     def backfill_from_amiiboapi(self, amiibos):
         """
@@ -734,7 +830,9 @@ class AmiiboLifeScraper(LoggingMixin):
         try:
             # Fetch all amiibos from AmiiboAPI
             self.log_info("Fetching complete amiibo data from AmiiboAPI...")
-            response = requests.get("https://amiiboapi.org/api/amiibo/", timeout=30)
+            response = _SCRAPER_SESSION.get(
+                "https://amiiboapi.org/api/amiibo/", timeout=30
+            )
             response.raise_for_status()
             api_data = response.json()
             api_amiibos = api_data.get("amiibo", [])
@@ -743,7 +841,7 @@ class AmiiboLifeScraper(LoggingMixin):
                 self.log_warning("No amiibos returned from AmiiboAPI")
                 return 0
 
-            self.log_info(f"Loaded {len(api_amiibos)} amiibos from AmiiboAPI")
+            self.log_info("Loaded %s amiibos from AmiiboAPI", len(api_amiibos))
 
             # Find all amiibos that need backfilling
             needs_backfill = [a for a in amiibos if a.get("is_upcoming")]
@@ -751,7 +849,7 @@ class AmiiboLifeScraper(LoggingMixin):
                 self.log_info("No amiibos need backfilling")
                 return 0
 
-            self.log_info(f"Found {len(needs_backfill)} amiibos needing backfill")
+            self.log_info("Found %s amiibos needing backfill", len(needs_backfill))
 
             backfilled_count = 0
             for placeholder in needs_backfill:
@@ -763,13 +861,14 @@ class AmiiboLifeScraper(LoggingMixin):
                     self.backfill_amiibo_data(placeholder, match)
                     backfilled_count += 1
                     self.log_info(
-                        f"Backfilled: {placeholder['name']}",
+                        "Backfilled: %s",
+                        placeholder["name"],
                         head=match.get("head"),
                         tail=match.get("tail"),
                     )
                 else:
                     self.log_warning(
-                        f"Could not find AmiiboAPI match for: {placeholder['name']}"
+                        "Could not find AmiiboAPI match for: %s", placeholder["name"]
                     )
 
             return backfilled_count
@@ -857,6 +956,8 @@ class NintendoDotComScraper(LoggingMixin):
         self.min_similarity = min_similarity
         self.cache_hours = cache_hours
         self.database_path = Path(__file__).parent / "data" / "amiibo_database.json"
+        self._normalized_names = {}
+        self._word_sets = {}
 
     def should_run(self):
         """
@@ -897,9 +998,10 @@ class NintendoDotComScraper(LoggingMixin):
             matched_count = 0
             new_count = 0
             updated_amiibos = []
+            name_index = self.index_by_name(existing_amiibos)
 
             for scraped in scraped_amiibos:
-                match = self.find_best_match(scraped, existing_amiibos)
+                match = self.find_best_match(scraped, existing_amiibos, name_index)
 
                 if match:
                     matched_count += 1
@@ -909,6 +1011,9 @@ class NintendoDotComScraper(LoggingMixin):
                     new_count += 1
                     new_amiibo = self.create_placeholder_amiibo(scraped)
                     existing_amiibos.append(new_amiibo)
+                    name_index.setdefault(
+                        self._normalized_name(new_amiibo["name"]), []
+                    ).append(new_amiibo)
 
             # Backfill placeholders with AmiiboAPI data
             backfilled_count = 0
@@ -950,21 +1055,21 @@ class NintendoDotComScraper(LoggingMixin):
         To:
         /image/upload/f_png/q_auto/amiibo/...
         """
-        return re.sub(
-            r"/image/upload/.+?/amiibo/", "/image/upload/f_png/q_auto/amiibo/", url
-        )
+        return _IMAGE_TRANSFORMS.sub("/image/upload/f_png/q_auto/amiibo/", url)
 
     def scrape_nintendo_amiibos(self):
         """Scrape amiibos from Nintendo's lineup page"""
         url = "https://www.nintendo.com/us/amiibo/line-up/"
 
         try:
-            response = requests.get(url, timeout=30)
+            response = _SCRAPER_SESSION.get(url, timeout=30)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = BeautifulSoup(
+                response.content, "html.parser", parse_only=NINTENDO_DETAIL_LINKS
+            )
 
             amiibos = []
-            amiibo_links = soup.find_all("a", href=re.compile(r"/us/amiibo/detail/"))
+            amiibo_links = soup.find_all("a", href=NINTENDO_DETAIL_HREF)
 
             for link in amiibo_links:
                 try:
@@ -972,7 +1077,8 @@ class NintendoDotComScraper(LoggingMixin):
                     name = link.get("aria-label", "").strip()
                     if not name:
                         self.log_warning(
-                            f"No aria-label found in link: {link.get('href', 'unknown')}"
+                            "No aria-label found in link: %s",
+                            link.get("href", "unknown"),
                         )
                         continue
 
@@ -1012,7 +1118,7 @@ class NintendoDotComScraper(LoggingMixin):
 
                     # Skip sets, bundles, and grouped items
                     if self.is_set_or_bundle(name):
-                        self.log_info(f"Skipping set/bundle: {name}")
+                        self.log_info("Skipping set/bundle: %s", name)
                         continue
 
                     amiibos.append(
@@ -1036,31 +1142,26 @@ class NintendoDotComScraper(LoggingMixin):
 
     def contains_date(self, text):
         """Check if text contains a date pattern"""
-        date_patterns = [
-            r"\d{1,2}/\d{1,2}/\d{2,4}",
-            r"Available\s+\d",
-            r"20\d{2}",
-        ]
-        return any(re.search(pattern, text) for pattern in date_patterns)
+        return _DATE_ANY.search(text) is not None
 
     def parse_release_date(self, date_text):
         """Parse release date from text"""
         if not date_text:
             return None
 
-        date_match = re.search(r"(\d{1,2}/\d{1,2}/\d{2,4})", date_text)
+        date_match = _MDY_DATE.search(date_text)
         if date_match:
-            date_str = date_match.group(1)
-            try:
-                if len(date_str.split("/")[2]) == 2:
-                    date_obj = datetime.strptime(date_str, "%m/%d/%y")
-                else:
-                    date_obj = datetime.strptime(date_str, "%m/%d/%Y")
-                return date_obj.strftime("%Y-%m-%d")
-            except ValueError:
-                pass
+            month, day, year = date_match.groups()
+            if len(year) == 2:
+                # Same pivot as strptime's %y: 69-99 are the 1900s
+                year = str((1900 if int(year) >= 69 else 2000) + int(year))
+            if len(year) == 4:
+                try:
+                    return date(int(year), int(month), int(day)).isoformat()
+                except ValueError:
+                    pass
 
-        year_match = re.search(r"(20\d{2})", date_text)
+        year_match = _YEAR.search(date_text)
         if year_match:
             # Use December 31st as default when only year is known
             # This prevents misleading users that it released early in the year
@@ -1070,7 +1171,7 @@ class NintendoDotComScraper(LoggingMixin):
 
     def clean_series(self, series_text):
         """Clean series name by removing ' series' suffix"""
-        return re.sub(r"\s+series$", "", series_text, flags=re.IGNORECASE)
+        return _SERIES_SUFFIX.sub("", series_text)
 
     def is_set_or_bundle(self, name):
         """
@@ -1112,7 +1213,7 @@ class NintendoDotComScraper(LoggingMixin):
                 return True
 
         # Check for patterns like "Series N" at the end (card series)
-        if re.search(r"series\s+\d+$", name_lower):
+        if _CARD_SERIES_NUMBER.search(name_lower):
             return True
 
         return False
@@ -1120,20 +1221,29 @@ class NintendoDotComScraper(LoggingMixin):
     def load_existing_amiibos(self):
         """Load existing amiibos from JSON file"""
         try:
-            with self.database_path.open(encoding="utf-8") as f:
-                data = json.load(f)
-                return data.get("amiibo", [])
+            data = json.loads(self.database_path.read_bytes())
+            return data.get("amiibo", [])
         except (FileNotFoundError, json.JSONDecodeError) as e:
             self.log_warning("Could not load database", error=str(e))
             return []
 
-    def find_best_match(self, scraped_amiibo, existing_amiibos):
+    def index_by_name(self, amiibos):
+        """Group amiibos by normalized name for exact lookups before fuzzing."""
+        index = {}
+        for amiibo in amiibos:
+            name = self._normalized_name(amiibo.get("name", ""))
+            index.setdefault(name, []).append(amiibo)
+        return index
+
+    def find_best_match(self, scraped_amiibo, existing_amiibos, name_index=None):
         """
         Find best matching amiibo using fuzzy name matching and date comparison.
 
         Args:
             scraped_amiibo: Dict with 'name', 'release_date', etc.
             existing_amiibos: List of existing amiibo dicts
+            name_index: Optional index_by_name() of existing_amiibos; an
+                exact name hit skips the fuzzy scan
 
         Returns:
             Best matching amiibo or None
@@ -1142,14 +1252,16 @@ class NintendoDotComScraper(LoggingMixin):
         scraped_date = scraped_amiibo.get("release_date")
 
         scraped_clean = self.normalize_name(scraped_name)
+        if name_index is not None:
+            exact = name_index.get(scraped_clean)
+            if exact:
+                return exact[0]
+
         best_match = None
         best_score = 0
 
         for amiibo in existing_amiibos:
-            existing_clean = self.normalize_name(amiibo.get("name", ""))
-
-            # Calculate name similarity
-            name_score = self.calculate_similarity(scraped_clean, existing_clean)
+            existing_clean = self._normalized_name(amiibo.get("name", ""))
 
             # Boost score if release dates match
             date_boost = 0
@@ -1164,6 +1276,18 @@ class NintendoDotComScraper(LoggingMixin):
                     # Close dates give smaller boost (within 30 days)
                     date_boost = 0.15
 
+            # Skip the full SequenceMatcher pass when even the optimistic
+            # score cannot beat the current best or reach the threshold.
+            ceiling = min(
+                1.0,
+                self.similarity_upper_bound(scraped_clean, existing_clean) + date_boost,
+            )
+            if ceiling <= best_score or ceiling < self.min_similarity:
+                continue
+
+            # Calculate name similarity
+            name_score = self.calculate_similarity(scraped_clean, existing_clean)
+
             # Combined score
             final_score = min(1.0, name_score + date_boost)
 
@@ -1173,8 +1297,10 @@ class NintendoDotComScraper(LoggingMixin):
 
         if not best_match:
             self.log_warning(
-                f"✗ No match for: '{scraped_name}' "
-                f"(best score: {best_score:.2f}, threshold: {self.min_similarity})"
+                "✗ No match for: '%s' (best score: %.2f, threshold: %s)",
+                scraped_name,
+                best_score,
+                self.min_similarity,
             )
 
         return best_match
@@ -1191,25 +1317,35 @@ class NintendoDotComScraper(LoggingMixin):
         # not a variant tag: "Kirby (& Warp Star)" must converge with the series
         # page form "Kirby & Warp Star". Unwrap "(& Companion)" before the
         # generic variant strip below so both forms normalize identically.
-        name = re.sub(r"\s*\(\s*&\s*(.*?)\)", r" \1", name)
+        name = _COMPANION_PARENS.sub(r" \1", name)
 
         # Remove common variant indicators in parentheses
-        name = re.sub(
-            r"\s*\(.*?\)\s*", " ", name
-        )  # Remove (Side Order), (Alterna), etc.
+        name = _VARIANT_PARENS.sub(" ", name)  # Remove (Side Order), (Alterna), etc.
 
         # Remove common variant suffixes with dashes
-        name = re.sub(r"\s*-\s*side order\s*$", "", name, flags=re.IGNORECASE)
-        name = re.sub(r"\s*-\s*alterna\s*$", "", name, flags=re.IGNORECASE)
+        name = _SIDE_ORDER_SUFFIX.sub("", name)
+        name = _ALTERNA_SUFFIX.sub("", name)
 
         # Remove special characters but keep spaces
-        name = re.sub(r"[^\w\s]", "", name)
+        name = _NON_WORD.sub("", name)
 
         # Normalize whitespace
-        name = re.sub(r"\s+", " ", name).strip()
+        name = _WHITESPACE.sub(" ", name).strip()
 
         return name
 
+    def _normalized_name(self, name):
+        cached = self._normalized_names.get(name)
+        if cached is None:
+            cached = self._normalized_names[name] = self.normalize_name(name)
+        return cached
+
+    def _word_set(self, name):
+        cached = self._word_sets.get(name)
+        if cached is None:
+            cached = self._word_sets[name] = frozenset(name.split())
+        return cached
+
     def calculate_similarity(self, name1, name2):
         """
         Calculate fuzzy similarity between two names using multiple methods.
@@ -1222,15 +1358,29 @@ class NintendoDotComScraper(LoggingMixin):
 
         # Method 1: SequenceMatcher for character-level fuzzy matching
         sequence_score = SequenceMatcher(None, name1, name2).ratio()
+        return self._blend_similarity(sequence_score, name1, name2)
 
+    def similarity_upper_bound(self, name1, name2):
+        """
+        Cheap ceiling on calculate_similarity.
+
+        quick_ratio() is never below ratio(), and the rest of the blend is
+        computed exactly, so a candidate whose bound cannot win can be skipped.
+        """
+        if not name1 or not name2:
+            return 0
+
+        sequence_bound = SequenceMatcher(None, name1, name2).quick_ratio()
+        return self._blend_similarity(sequence_bound, name1, name2)
+
+    def _blend_similarity(self, sequence_score, name1, name2):
         # Method 2: Word-based matching (Jaccard similarity)
-        words1 = set(name1.split())
-        words2 = set(name2.split())
+        words1 = self._word_set(name1)
+        words2 = self._word_set(name2)
 
         if words1 and words2:
-            intersection = words1.intersection(words2)
-            union = words1.union(words2)
-            word_score = len(intersection) / len(union)
+            shared = len(words1 & words2)
+            word_score = shared / (len(words1) + len(words2) - shared)
         else:
             word_score = 0
 
@@ -1258,8 +1408,8 @@ class NintendoDotComScraper(LoggingMixin):
             True if dates are within threshold, False otherwise
         """
         try:
-            d1 = datetime.strptime(date1, "%Y-%m-%d")
-            d2 = datetime.strptime(date2, "%Y-%m-%d")
+            d1 = date.fromisoformat(date1)
+            d2 = date.fromisoformat(date2)
             days_apart = abs((d1 - d2).days)
             return days_apart <= days_threshold
         except (ValueError, TypeError):
@@ -1314,8 +1464,10 @@ class NintendoDotComScraper(LoggingMixin):
         """Save amiibos back to JSON file"""
         data = {"amiibo": amiibos}
 
-        with self.database_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Encode up front and write once; json.dump issues a write per token.
+        self.database_path.write_text(
+            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
 
     def backfill_from_amiiboapi(self, amiibos):
         """
@@ -1325,7 +1477,9 @@ class NintendoDotComScraper(LoggingMixin):
         try:
             # Fetch all amiibos from AmiiboAPI
             self.log_info("Fetching complete amiibo data from AmiiboAPI...")
-            response = requests.get("https://amiiboapi.org/api/amiibo/", timeout=30)
+            response = _SCRAPER_SESSION.get(
+                "https://amiiboapi.org/api/amiibo/", timeout=30
+            )
             response.raise_for_status()
             api_data = response.json()
             api_amiibos = api_data.get("amiibo", [])
@@ -1334,7 +1488,7 @@ class NintendoDotComScraper(LoggingMixin):
                 self.log_warning("No amiibos returned from AmiiboAPI")
                 return 0
 
-            self.log_info(f"Loaded {len(api_amiibos)} amiibos from AmiiboAPI")
+            self.log_info("Loaded %s amiibos from AmiiboAPI", len(api_amiibos))
 
             # Find all amiibos that need backfilling
             needs_backfill = [a for a in amiibos if a.get("is_upcoming")]
@@ -1342,7 +1496,7 @@ class NintendoDotComScraper(LoggingMixin):
                 self.log_info("No amiibos need backfilling")
                 return 0
 
-            self.log_info(f"Found {len(needs_backfill)} amiibos needing backfill")
+            self.log_info("Found %s amiibos needing backfill", len(needs_backfill))
 
             backfilled_count = 0
             for placeholder in needs_backfill:
@@ -1354,13 +1508,14 @@ class NintendoDotComScraper(LoggingMixin):
                     self.backfill_amiibo_data(placeholder, match)
                     backfilled_count += 1
                     self.log_info(
-                        f"Backfilled: {placeholder['name']}",
+                        "Backfilled: %s",
+                        placeholder["name"],
                         head=match.get("head"),
                         tail=match.get("tail"),
                     )
                 else:
                     self.log_warning(
-                        f"Could not find AmiiboAPI match for: {placeholder['name']}"
+                        "Could not find AmiiboAPI match for: %s", placeholder["name"]
                     )
 
             return backfilled_count
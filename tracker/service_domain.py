@@ -1,5 +1,5 @@
 import json
-from functools import cached_property
+from functools import cached_property, lru_cache
 from datetime import datetime
 from pathlib import Path
 
@@ -8,6 +8,15 @@ from tracker.google_sheet_client_manager import GoogleSheetClientManager
 from tracker.helpers import LoggingMixin, AmiiboRemoteFetchMixin, AmiiboLocalFetchMixin
 
 
+@lru_cache(maxsize=256)
+def _format_iso_date(date_str: str) -> str:
+    """Turn YYYY-MM-DD into MM/DD/YYYY; many amiibos share a release date."""
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").strftime("%m/%d/%Y")
+    except ValueError:
+        return date_str
+
+
 class AmiiboService(LoggingMixin, AmiiboRemoteFetchMixin, AmiiboLocalFetchMixin):
     HEADER = [
         "Amiibo ID",
@@ -46,10 +55,19 @@ class AmiiboService(LoggingMixin, AmiiboRemoteFetchMixin, AmiiboLocalFetchMixin)
 
         return self._fetch_local_amiibos()
 
-    def seed_new_amiibos(self, amiibos: list[dict]):
-        existing_values = self.google_sheet_client.execute_worksheet_operation(
+    @cached_property
+    def _sheet_values(self) -> list[list[str]]:
+        """Every row of the worksheet, read once and shared by seed and status."""
+        return self.google_sheet_client.execute_worksheet_operation(
             self.sheet.get_all_values
         )
+
+    def _invalidate_sheet_values(self):
+        self.__dict__.pop("_sheet_values", None)
+        self.__dict__.pop("_id_to_row", None)
+
+    def seed_new_amiibos(self, amiibos: list[dict]):
+        existing_values = self._sheet_values
         existing_map: dict[str, tuple[int, list[str]]] = {}
         for idx, row in enumerate(existing_values[1:], start=2):
             if row:
@@ -84,7 +102,7 @@ class AmiiboService(LoggingMixin, AmiiboRemoteFetchMixin, AmiiboLocalFetchMixin)
                     skipped_placeholders.append(amiibo.get("name", "Unknown"))
                     continue
 
-            amiibo_id = amiibo["head"] + amiibo["gameSeries"] + amiibo["tail"]
+            amiibo_id = f"{amiibo['head']}{amiibo['gameSeries']}{amiibo['tail']}"
             release_date = self._format_release_date(amiibo.get("release"))
 
             if amiibo_id not in existing_map:
@@ -132,6 +150,9 @@ class AmiiboService(LoggingMixin, AmiiboRemoteFetchMixin, AmiiboLocalFetchMixin)
                 self.sheet.append_rows, new_rows, value_input_option="USER_ENTERED"
             )
 
+        if updates or new_rows:
+            self._invalidate_sheet_values()
+
         # Log skipped placeholders
         if skipped_placeholders:
             self.log_info(
@@ -140,9 +161,7 @@ class AmiiboService(LoggingMixin, AmiiboRemoteFetchMixin, AmiiboLocalFetchMixin)
             )
 
     def _status_rows(self):
-        return self.google_sheet_client.execute_worksheet_operation(
-            self.sheet.get_all_values
-        )[1:]
+        return self._sheet_values[1:]
 
     @staticmethod
     def _column_status(rows, column):
@@ -165,23 +184,31 @@ class AmiiboService(LoggingMixin, AmiiboRemoteFetchMixin, AmiiboLocalFetchMixin)
             self._column_status(rows, self.FAVORITE_COL),
         )
 
-    def _toggle_column(self, amiibo_id: str, column: int, enabled: bool):
-        # Use wrapper to handle API errors gracefully
-        current_ids = self.google_sheet_client.execute_worksheet_operation(
+    @cached_property
+    def _id_to_row(self) -> dict[str, int]:
+        """Map each Amiibo ID to its 1-based sheet row from one column read."""
+        ids = self.google_sheet_client.execute_worksheet_operation(
             self.sheet.col_values, 1
-        )[1:]
-        if amiibo_id not in current_ids:
+        )
+        id_to_row: dict[str, int] = {}
+        for row, amiibo_id in enumerate(ids[1:], start=2):
+            if amiibo_id:
+                id_to_row.setdefault(amiibo_id, row)
+        return id_to_row
+
+    def _toggle_column(self, amiibo_id: str, column: int, enabled: bool):
+        row = self._id_to_row.get(amiibo_id)
+        if row is None:
             return False
 
-        cell = self.google_sheet_client.execute_worksheet_operation(
-            self.sheet.find, amiibo_id
-        )
+        # Use wrapper to handle API errors gracefully
         self.google_sheet_client.execute_worksheet_operation(
             self.sheet.update_cell,
-            cell.row,
+            row,
             column,
             "1" if enabled else "0",
         )
+        self.__dict__.pop("_sheet_values", None)
         return True
 
     def toggle_collected(self, amiibo_id: str, action: str):
@@ -230,11 +257,7 @@ class AmiiboService(LoggingMixin, AmiiboRemoteFetchMixin, AmiiboLocalFetchMixin)
         for region in ["na", "eu", "jp", "au"]:
             date_str = release_info.get(region)
             if date_str:
-                try:
-                    parsed_date = datetime.strptime(date_str, "%Y-%m-%d")
-                    return parsed_date.strftime("%m/%d/%Y")
-                except ValueError:
-                    return date_str
+                return _format_iso_date(date_str)
         return None
 
 
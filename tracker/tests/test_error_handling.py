@@ -144,6 +144,64 @@ class TestExecuteWorksheetOperation:
         result = manager.execute_worksheet_operation(successful_operation, 5, 3)
         assert result == 8
 
+    @patch("tracker.google_sheet_client_manager.time.sleep")
+    def test_short_rate_limit_is_retried_after_header_delay(self, mock_sleep):
+        """Test that a 429 with a short Retry-After is retried transparently."""
+        manager = GoogleSheetClientManager(creds_json={"token": "test"})
+        responses = iter([APIError(MockResponse(429, headers={"Retry-After": "2"}))])
+
+        def flaky_operation():
+            error = next(responses, None)
+            if error:
+                raise error
+            return "ok"
+
+        assert manager.execute_worksheet_operation(flaky_operation) == "ok"
+        mock_sleep.assert_called_once_with(2)
+
+    @patch("tracker.google_sheet_client_manager.time.sleep")
+    def test_bad_gateway_exhausts_retries(self, mock_sleep):
+        """Test that repeated 502s end in ServiceUnavailableError."""
+        manager = GoogleSheetClientManager(creds_json={"token": "test"})
+
+        def failing_operation():
+            raise APIError(MockResponse(502))
+
+        with pytest.raises(ServiceUnavailableError):
+            manager.execute_worksheet_operation(failing_operation)
+
+        assert mock_sleep.call_count == manager.MAX_RETRIES - 1
+
+    @patch("tracker.google_sheet_client_manager.time.sleep")
+    def test_bad_gateway_on_append_is_not_retried(self, mock_sleep):
+        """Test that a 502 on an append fails fast instead of re-appending."""
+        manager = GoogleSheetClientManager(creds_json={"token": "test"})
+        calls = []
+
+        def append_rows(rows):
+            calls.append(rows)
+            raise APIError(MockResponse(502))
+
+        with pytest.raises(ServiceUnavailableError):
+            manager.execute_worksheet_operation(append_rows, [["row"]])
+
+        assert calls == [[["row"]]]
+        mock_sleep.assert_not_called()
+
+    @patch("tracker.google_sheet_client_manager.time.sleep")
+    def test_long_rate_limit_is_returned_without_waiting(self, mock_sleep):
+        """Test that a Retry-After beyond the in-request cap is not slept on."""
+        manager = GoogleSheetClientManager(creds_json={"token": "test"})
+
+        def throttled_operation():
+            raise APIError(MockResponse(429, headers={"Retry-After": "20"}))
+
+        with pytest.raises(RateLimitError) as excinfo:
+            manager.execute_worksheet_operation(throttled_operation)
+
+        assert excinfo.value.retry_after == 20
+        mock_sleep.assert_not_called()
+
 
 class TestServiceErrorPropagation:
     """Test that service methods properly propagate errors from worksheet operations."""
@@ -220,7 +278,7 @@ class TestOAuthCallbackErrorHandling:
     @override_settings(ALLOWED_HOSTS=["*", "testserver", "localhost"])
     @patch("tracker.views.build_sheet_client_manager")
     @patch("tracker.views.ensure_spreadsheet_session")
-    @patch("tracker.views.Flow")
+    @patch("tracker.google_sheet_client_manager.Flow")
     @patch("tracker.views.googleapiclient")
     def test_oauth_callback_insufficient_scopes_redirects(
         self,
@@ -283,7 +341,7 @@ class TestOAuthCallbackErrorHandling:
     @override_settings(ALLOWED_HOSTS=["*", "testserver", "localhost"])
     @patch("tracker.views.build_sheet_client_manager")
     @patch("tracker.views.ensure_spreadsheet_session")
-    @patch("tracker.views.Flow")
+    @patch("tracker.google_sheet_client_manager.Flow")
     @patch("tracker.views.googleapiclient")
     def test_oauth_callback_permission_error_clears_session(
         self,
@@ -141,7 +141,7 @@ class TestNintendoScraperAPIView:
 class TestScraperAPIIntegration:
     """Integration tests for scraper API endpoint."""
 
-    @patch("tracker.scrapers.requests.get")
+    @patch("tracker.scrapers._SCRAPER_SESSION.get")
     @patch("tracker.scrapers.AmiiboLifeScraper.load_existing_amiibos")
     @patch("tracker.scrapers.AmiiboLifeScraper.save_amiibos")
     def test_full_api_workflow(self, mock_save, mock_load, mock_get, request_factory):
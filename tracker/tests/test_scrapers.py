@@ -165,6 +165,22 @@ class TestNintendoDotComScraper:
         # Should be low but not necessarily 0 due to character-level matching
         assert similarity < 0.3
 
+    def test_similarity_upper_bound_never_undershoots(self):
+        """The pruning bound must be >= the real score for any pair."""
+        scraper = NintendoDotComScraper()
+
+        pairs = [
+            ("mario", "mario super"),
+            ("super mario", "mario kart"),
+            ("mario", "zelda"),
+            ("inkling girl", "girl inkling"),
+            ("", "mario"),
+        ]
+        for name1, name2 in pairs:
+            assert scraper.similarity_upper_bound(
+                name1, name2
+            ) >= scraper.calculate_similarity(name1, name2)
+
     def test_contains_date_patterns(self):
         """Test date pattern detection."""
         scraper = NintendoDotComScraper()
@@ -202,6 +218,12 @@ class TestNintendoDotComScraper:
         result = scraper.parse_release_date("No date available")
         assert result is None
 
+    def test_parse_release_date_invalid_day_falls_back_to_year(self):
+        """An impossible calendar date falls back to the year default."""
+        scraper = NintendoDotComScraper()
+
+        assert scraper.parse_release_date("Available 02/30/2026") == "2026-12-31"
+
     def test_clean_series(self):
         """Test series name cleaning."""
         scraper = NintendoDotComScraper()
@@ -266,6 +288,39 @@ class TestNintendoDotComScraper:
         assert match is not None
         assert match["name"] == "Mario"
 
+    def test_find_best_match_normalizes_existing_names_once(self, sample_amiibos):
+        """Existing names are normalized once across repeated match calls."""
+        scraper = NintendoDotComScraper()
+
+        with patch.object(
+            scraper, "normalize_name", wraps=scraper.normalize_name
+        ) as normalize:
+            for name in ("Mario Bros", "Samus", "Zelda"):
+                scraper.find_best_match(
+                    {"name": name, "release_date": None}, sample_amiibos
+                )
+
+        existing_names = sorted(amiibo["name"] for amiibo in sample_amiibos)
+        existing_calls = sorted(
+            call.args[0]
+            for call in normalize.call_args_list
+            if call.args[0] in existing_names
+        )
+        assert existing_calls == existing_names
+
+    def test_find_best_match_exact_name_skips_fuzzy_scan(self, sample_amiibos):
+        """An exact normalized-name hit in the index never scores candidates."""
+        scraper = NintendoDotComScraper()
+        name_index = scraper.index_by_name(sample_amiibos)
+
+        with patch.object(scraper, "calculate_similarity") as similarity:
+            match = scraper.find_best_match(
+                {"name": "mario!", "release_date": None}, sample_amiibos, name_index
+            )
+
+        assert match["name"] == "Mario"
+        similarity.assert_not_called()
+
     def test_dates_are_close(self):
         """Test date proximity detection."""
         scraper = NintendoDotComScraper()
@@ -388,7 +443,7 @@ class TestNintendoDotComScraper:
         assert len(data["amiibo"]) == 2
         assert data["amiibo"][0]["name"] == "Mario"
 
-    @patch("tracker.scrapers.requests.get")
+    @patch("tracker.scrapers._SCRAPER_SESSION.get")
     def test_scrape_nintendo_amiibos_success(self, mock_get):
         """Test successful scraping from Nintendo website."""
         # Mock HTML response
@@ -418,7 +473,7 @@ class TestNintendoDotComScraper:
         assert result[1]["name"] == "Link"
         assert result[1]["series"] == "The Legend of Zelda"
 
-    @patch("tracker.scrapers.requests.get")
+    @patch("tracker.scrapers._SCRAPER_SESSION.get")
     def test_scrape_nintendo_amiibos_network_error(self, mock_get):
         """Test scraping with network error."""
         import requests
@@ -498,7 +553,7 @@ class TestNintendoDotComScraper:
 class TestScraperIntegration:
     """Integration tests for the scraper."""
 
-    @patch("tracker.scrapers.requests.get")
+    @patch("tracker.scrapers._SCRAPER_SESSION.get")
     def test_end_to_end_scraping(self, mock_get, tmp_path):
         """Test complete end-to-end scraping workflow."""
         # Setup
@@ -724,7 +779,7 @@ class TestAmiiboLifeScraper:
         noir = next(a for a in result if "Noir" in a["name"])
         assert noir["release_dates"] == {"jp": "2026-01-01"}
 
-    @patch("tracker.scrapers.requests.get")
+    @patch("tracker.scrapers._SCRAPER_SESSION.get")
     def test_discover_series_excludes_card_series(self, mock_get):
         """Series are discovered from the releases nav, with card/set series
         (tagged "amiibo cards" on any of their links) dropped."""
@@ -749,7 +804,7 @@ class TestAmiiboLifeScraper:
             "super-mario": "Super Mario",
         }
 
-    @patch("tracker.scrapers.requests.get")
+    @patch("tracker.scrapers._SCRAPER_SESSION.get")
     def test_scrape_series_pages_skips_already_dated_figures(self, mock_get):
         """Figures already seen on the releases timeline are skipped; only the
         undated (TBA) ones are returned."""
@@ -830,6 +885,18 @@ class TestAmiiboLifeScraper:
         assert match is not None
         assert match["name"] == "Kirby (& Warp Star)"
 
+    def test_find_best_match_exact_name_respects_series(self):
+        """The exact-name index only short-circuits on a compatible series."""
+        scraper = AmiiboLifeScraper()
+        existing = [
+            {"name": "King Dedede", "amiiboSeries": "Super Smash Bros.", "release": {}},
+            {"name": "King Dedede", "amiiboSeries": "Kirby", "release": {}},
+        ]
+        name_index = scraper.index_by_name(existing)
+
+        scraped = {"name": "King Dedede", "series": "Kirby", "release_dates": {}}
+        assert scraper.find_best_match(scraped, existing, name_index) is existing[1]
+
 
     def test_is_set_or_bundle(self):
         """Test detection of sets, bundles, and grouped items."""
@@ -1014,7 +1081,7 @@ class TestAmiiboLifeScraper:
         assert "amiibo" in data
         assert len(data["amiibo"]) == 2
 
-    @patch("tracker.scrapers.requests.get")
+    @patch("tracker.scrapers._SCRAPER_SESSION.get")
     def test_scrape_amiibo_life_success(self, mock_get):
         """Test successful scraping from amiibo.life website."""
         mock_response = Mock()
@@ -1083,7 +1150,7 @@ class TestAmiiboLifeScraper:
         assert result[1]["series"] == "Splatoon"
         assert result[1]["release_dates"]["jp"] == "2015-05-28"
 
-    @patch("tracker.scrapers.requests.get")
+    @patch("tracker.scrapers._SCRAPER_SESSION.get")
     def test_scrape_amiibo_life_network_error(self, mock_get):
         """Test scraping with network error."""
         import requests
@@ -1095,7 +1162,7 @@ class TestAmiiboLifeScraper:
 
         assert result == []
 
-    @patch("tracker.scrapers.requests.get")
+    @patch("tracker.scrapers._SCRAPER_SESSION.get")
     def test_scrape_amiibo_life_skips_games(self, mock_get):
         """Test that game cards are skipped (only figure-card divs are processed)."""
         mock_response = Mock()
@@ -1141,7 +1208,7 @@ class TestAmiiboLifeScraper:
         assert len(result) == 1
         assert result[0]["name"] == "Mario"
 
-    @patch("tracker.scrapers.requests.get")
+    @patch("tracker.scrapers._SCRAPER_SESSION.get")
     def test_scrape_amiibo_life_handles_cards(self, mock_get):
         """Test that amiibo cards are properly identified."""
         mock_response = Mock()
@@ -1254,7 +1321,7 @@ class TestAmiiboLifeScraper:
 class TestAmiiboLifeScraperIntegration:
     """Integration tests for AmiiboLifeScraper."""
 
-    @patch("tracker.scrapers.requests.get")
+    @patch("tracker.scrapers._SCRAPER_SESSION.get")
     def test_end_to_end_scraping(self, mock_get, tmp_path):
         """Test complete end-to-end scraping workflow."""
         db_path = tmp_path / "amiibo_database.json"
@@ -400,6 +400,37 @@ class TestAmiiboServiceFavorites:
         # Single read of the sheet for both maps.
         assert mock_sheet.get_all_values.call_count == 1
 
+    def test_seed_then_status_share_one_read(self):
+        service, mock_sheet = _service_with_rows(
+            [
+                self.HEADER_7,
+                [
+                    "09d00301Super Mario02bb0e02",
+                    "Mario",
+                    "Super Mario",
+                    "11/21/2014",
+                    "Figure",
+                    "1",
+                    "0",
+                ],
+            ]
+        )
+        service.seed_new_amiibos(
+            [
+                {
+                    "name": "Mario",
+                    "head": "09d00301",
+                    "tail": "02bb0e02",
+                    "gameSeries": "Super Mario",
+                    "type": "Figure",
+                    "release": {"na": "2014-11-21"},
+                }
+            ]
+        )
+        collected, _ = service.get_collected_and_favorite_status()
+        assert collected == {"09d00301Super Mario02bb0e02": "1"}
+        assert mock_sheet.get_all_values.call_count == 1
+
     def test_toggle_favorite_writes_column_g(self):
         service, mock_sheet = _service_with_rows(
             [self.HEADER_7, ["idA", "A", "S", "", "Figure", "0", "0"]]
@@ -716,6 +716,10 @@ def oauth_redirect_uri_for_request(request):
     return configured_redirect_uri
 
 
+def build_oauth_flow(**flow_kwargs) -> Flow:
+    return GoogleSheetClientManager.get_flow(**flow_kwargs)
+
+
 def _set_oauth_configuration_error(request):
     request.session["oauth_error"] = {
         "message": (
@@ -744,9 +748,7 @@ class OAuthView(View, LoggingMixin):
             request.session.pop("oauth_next", None)
 
         try:
-            flow = Flow.from_client_secrets_file(
-                GoogleSheetClientManager.client_secret_path(),
-                scopes=OauthConstants.SCOPES,
+            flow = build_oauth_flow(
                 redirect_uri=oauth_redirect_uri_for_request(request),
                 autogenerate_code_verifier=True,
             )
@@ -809,9 +811,7 @@ class OAuthCallbackView(View, LoggingMixin):
             return redirect("oauth_login")
 
         try:
-            flow = Flow.from_client_secrets_file(
-                GoogleSheetClientManager.client_secret_path(),
-                scopes=OauthConstants.SCOPES,
+            flow = build_oauth_flow(
                 redirect_uri=oauth_redirect_uri_for_request(request),
                 state=oauth_state,
                 code_verifier=oauth_code_verifier,